@@ -1,5 +1,10 @@
 import csv
-from netmiko import ConnectHandler
+import os
+import sys
+
+# fleet_push.py (shared with the switch script) is in the parent directory
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+import fleet_push
 
 # Define the router credentials and connection parameters
 router = {
@@ -12,6 +17,13 @@ router = {
 }
 remote_execution = False  # Set to True to enable remote execution on the router
 
+# Fleet push settings: set inventory_file to configure every router in the inventory in parallel
+inventory_file = None  # e.g. 'inventory.csv' (columns: host;csv_file), None = single router above
+max_workers = 20  # Maximum number of routers configured at the same time
+device_timeout = 60  # Per-router timeout (seconds) for connecting and for each read
+device_deadline = 600  # Maximum total time (seconds) for one router, checked between config commands
+cmd_window = 10  # Config commands sent ahead of their echo (1 = wait for every echo)
+
 # Function to handle the configuration of interfaces, VLANs, and routing
 def handle_interface(interface, vlan, description, ip_address, subnet_mask, default_gateway):
     config_commands = []
@@ -102,8 +114,33 @@ def save_config_to_file(config_commands, output_file):
             file.write(command + '\n')
     print(f"Configuration commands saved to {output_file}")
 
+# Function to connect to one router and apply its configuration commands
+def push_config(device, config_commands, read_timeout=15, deadline=None):
+    fleet_push.push_config(device, config_commands, read_timeout=read_timeout, cmd_window=cmd_window, deadline=deadline)
+
+# Function to generate (and optionally push) the configuration for one inventory entry
+def push_device(entry, deadline):
+    host = entry['host']
+    device = fleet_push.device_params(router, host, device_timeout)
+    config_commands = generate_config(entry['csv_file'])
+    save_config_to_file(config_commands, f"router_config_{host}.txt")
+    if remote_execution:
+        push_config(device, config_commands, read_timeout=device_timeout, deadline=deadline)
+
 # Main function to run the script
 def main():
+    # Fleet mode: configure every router listed in the inventory file
+    if inventory_file:
+        inventory = fleet_push.load_inventory(inventory_file)
+        results = fleet_push.push_inventory(inventory, push_device, max_workers, device_deadline)
+        failed = [result for result in results if not result['success']]
+        print(f"Configuration processed for {len(results) - len(failed)}/{len(results)} routers.")
+        for result in failed:
+            print(f"Failed: {result['host']} ({result['error']})")
+        if not remote_execution:
+            print("Remote execution is disabled. Configuration commands are ONLY saved to files.")
+        return
+
     # File paths
     csv_file = 'config3.csv'  # Path to your CSV file
     output_file = 'router_config.txt'  # Path to save the generated config file
@@ -117,11 +154,8 @@ def main():
     # Connect to the router using Netmiko and apply the configuration
     if remote_execution:
         try:
-            with ConnectHandler(**router) as net_connect:
-                net_connect.enable()  # Enter enable mode
-                # Send configuration commands to the router
-                net_connect.send_config_set(config_commands, read_timeout=15)
-                print("Configuration applied successfully to the router.")
+            push_config(router, config_commands)
+            print("Configuration applied successfully to the router.")
         except Exception as e:
             print(f"Error: {e}")
     else:
@@ -58,9 +58,12 @@ from netmiko.exceptions import (  # noqa
 from netmiko.exceptions import ConfigInvalidException  # noqa
 from netmiko.exceptions import ReadException, ReadTimeout  # noqa
 from netmiko.exceptions import NetmikoBaseException, ConnectionException  # noqa
-from netmiko.ssh_autodetect import SSHDetect  # noqa
+from netmiko.ssh_autodetect import SSHDetect, autodetect_many  # noqa
 from netmiko.base_connection import BaseConnection  # noqa
-from netmiko.scp_functions import file_transfer, progress_bar  # noqa
+from netmiko.scp_functions import file_transfer, file_transfer_many  # noqa
+from netmiko.scp_functions import progress_bar  # noqa
+from netmiko.async_connection import AsyncConnectHandler, AsyncConnection  # noqa
+from netmiko.connection_pool import ConnectionPool  # noqa
 
 # Alternate naming
 Netmiko = ConnectHandler
@@ -86,10 +89,15 @@ __all__ = (
     "InLineTransfer",
     "redispatch",
     "SSHDetect",
+    "autodetect_many",
     "BaseConnection",
     "Netmiko",
     "file_transfer",
+    "file_transfer_many",
     "progress_bar",
+    "AsyncConnectHandler",
+    "AsyncConnection",
+    "ConnectionPool",
 )
 
 # Cisco cntl-shift-six sequence
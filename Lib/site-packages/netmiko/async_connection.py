@@ -0,0 +1,266 @@
+"""asyncio interface to Netmiko connections for large-scale read-only collection.
+
+Connection setup (TCP, SSH key exchange, authentication and session_preparation) is
+blocking in paramiko and is run on an executor. Once connected, the command read loop
+runs on the event loop itself, so an idle or slow device does not hold an OS thread
+while its output is being collected. The platform specific prompt handling, paging
+disable, output sanitizing and the read loop itself (BaseConnection._pattern_reader) of
+the underlying driver are reused as-is.
+
+SSH channels are waited on with loop.add_reader(). Event loops without add_reader(),
+such as the default ProactorEventLoop on Windows, fall back to polling the channel every
+poll_delay seconds; select the selector event loop to avoid it:
+
+    asyncio.set_event_loop_policy(asyncio.WindowsSelectorEventLoopPolicy())
+
+Example:
+
+    async with await AsyncConnectHandler(**device) as conn:
+        output = await conn.send_command("show version")
+"""
+
+from typing import Any, Dict, List, Optional, Union
+from types import TracebackType
+from concurrent.futures import Executor
+import asyncio
+import functools
+import re
+
+from netmiko import log
+from netmiko.base_connection import BaseConnection
+from netmiko.channel import SSHChannel
+from netmiko.ssh_dispatcher import ConnectHandler
+from netmiko.utilities import structured_data_converter
+
+
+class AsyncConnection:
+    def __init__(
+        self, connection: BaseConnection, executor: Optional[Executor] = None
+    ) -> None:
+        """
+        Wrap a connected Netmiko driver object for use from asyncio.
+
+        :param connection: Connected Netmiko driver (as returned by ConnectHandler).
+
+        :param executor: Executor used for the blocking parts (disconnect). Defaults to the
+            event loop's default executor.
+        """
+        self.connection = connection
+        self.executor = executor
+        # Serialize the commands sent over this one session
+        self._lock = asyncio.Lock()
+        # Maximum time to wait for new data before re-checking the read_timeout
+        self.max_wait = 0.5
+        # Polling delay for channels (or event loops) without readiness notification
+        self.poll_delay = 0.01
+        # Cleared when the event loop raises NotImplementedError from add_reader()
+        self._use_add_reader = True
+
+    def __repr__(self) -> str:
+        return f"{self.__class__.__name__}({self.connection.host!r})"
+
+    @property
+    def base_prompt(self) -> str:
+        return self.connection.base_prompt
+
+    @property
+    def device_type(self) -> str:
+        return self.connection.device_type
+
+    async def __aenter__(self) -> "AsyncConnection":
+        return self
+
+    async def __aexit__(
+        self,
+        exc_type: Optional[type],
+        exc_value: Optional[BaseException],
+        traceback: Optional[TracebackType],
+    ) -> None:
+        await self.disconnect()
+
+    async def _wait_for_data(self, timeout: float) -> None:
+        """Wait until the channel is readable or until timeout expires."""
+        loop = asyncio.get_running_loop()
+        channel = self.connection.channel
+        remote_conn = getattr(channel, "remote_conn", None)
+        if (
+            not isinstance(channel, SSHChannel)
+            or remote_conn is None
+            or not self._use_add_reader
+        ):
+            await asyncio.sleep(min(timeout, self.poll_delay))
+            return
+        if remote_conn.recv_ready():
+            return
+        if remote_conn.closed or remote_conn.eof_received:
+            # A closed channel is always 'readable'; don't spin on it.
+            await asyncio.sleep(timeout)
+            return
+
+        # paramiko.Channel.fileno() is backed by a pipe that becomes readable when data
+        # is fed into the channel's receive buffer.
+        fd = remote_conn.fileno()
+        ready = loop.create_future()
+
+        def _set_ready() -> None:
+            # The reader callback can fire again before it is removed
+            if not ready.done():
+                ready.set_result(None)
+
+        try:
+            loop.add_reader(fd, _set_ready)
+        except NotImplementedError:
+            # e.g. ProactorEventLoop on Windows (see the module docstring)
+            log.debug(f"{loop!r} does not support add_reader(), polling the channel")
+            self._use_add_reader = False
+            await asyncio.sleep(min(timeout, self.poll_delay))
+            return
+        try:
+            await asyncio.wait_for(ready, timeout)
+        except asyncio.TimeoutError:
+            pass
+        finally:
+            loop.remove_reader(fd)
+
+    async def read_until_pattern(
+        self, pattern: str = "", read_timeout: float = 10.0, re_flags: int = 0
+    ) -> str:
+        """Read channel until pattern is detected.
+
+        Will return string up to and including pattern (see
+        BaseConnection.read_until_pattern).
+        """
+        reader = self.connection._pattern_reader(
+            pattern,
+            read_timeout=read_timeout,
+            re_flags=re_flags,
+            max_wait=self.max_wait,
+        )
+        try:
+            while True:
+                await self._wait_for_data(next(reader))
+        except StopIteration as stop:
+            output: str = stop.value
+            return output
+
+    async def send_command(
+        self,
+        command_string: str,
+        expect_string: Optional[str] = None,
+        read_timeout: float = 10.0,
+        strip_prompt: bool = True,
+        strip_command: bool = True,
+        normalize: bool = True,
+        use_textfsm: bool = False,
+        textfsm_template: Optional[str] = None,
+        use_ttp: bool = False,
+        ttp_template: Optional[str] = None,
+        use_genie: bool = False,
+        cmd_verify: bool = True,
+    ) -> Union[str, List[Any], Dict[str, Any]]:
+        """Execute command_string on the channel and wait for the prompt.
+
+        Same as BaseConnection.send_command(), except that the trailing prompt pattern is
+        based on the base_prompt discovered at connection time (auto_find_prompt=False).
+
+        :param command_string: The command to be executed on the remote device.
+
+        :param expect_string: Regular expression pattern to use for determining end of output.
+            If left blank will default to being based on router prompt.
+
+        :param read_timeout: Maximum time to wait looking for pattern. Will raise ReadTimeout
+            if timeout is exceeded.
+
+        :param strip_prompt: Remove the trailing router prompt from the output (default: True).
+
+        :param strip_command: Remove the echo of the command from the output (default: True).
+
+        :param normalize: Ensure the proper enter is sent at end of command (default: True).
+
+        :param use_textfsm: Process command output through TextFSM template (default: False).
+
+        :param textfsm_template: Name of template to parse output with; can be fully qualified
+            path, relative path, or name of file in current directory. (default: None).
+
+        :param use_ttp: Process command output through TTP template (default: False).
+
+        :param ttp_template: Name of template to parse output with; can be fully qualified
+            path, relative path, or name of file in current directory. (default: None).
+
+        :param use_genie: Process command output through PyATS/Genie parser (default: False).
+
+        :param cmd_verify: Verify command echo before proceeding (default: True).
+        """
+        conn = self.connection
+        if conn.global_cmd_verify is not None:
+            cmd_verify = conn.global_cmd_verify
+
+        if expect_string is not None:
+            search_pattern = expect_string
+        else:
+            search_pattern = re.escape(conn.base_prompt.strip())
+
+        if normalize:
+            command_string = conn.normalize_cmd(command_string)
+
+        async with self._lock:
+            try:
+                conn.write_channel(command_string)
+                output = ""
+                cmd = command_string.strip()
+                if cmd and cmd_verify:
+                    output = await self.read_until_pattern(
+                        pattern=re.escape(cmd), read_timeout=10
+                    )
+                    # Drop any echoed prompts that preceded the command echo
+                    lines = output.split(cmd)
+                    if len(lines) == 2:
+                        output = f"{cmd}{lines[-1]}"
+
+                output, _ = conn._first_line_handler(output, search_pattern)
+                if not re.search(search_pattern, output):
+                    output += await self.read_until_pattern(
+                        pattern=search_pattern, read_timeout=read_timeout
+                    )
+            finally:
+                if conn.session_log:
+                    conn.session_log.flush()
+
+        output = conn._sanitize_output(
+            output,
+            strip_command=strip_command,
+            command_string=command_string,
+            strip_prompt=strip_prompt,
+        )
+        return structured_data_converter(
+            command=command_string,
+            raw_data=output,
+            platform=conn.device_type,
+            use_textfsm=use_textfsm,
+            use_ttp=use_ttp,
+            use_genie=use_genie,
+            textfsm_template=textfsm_template,
+            ttp_template=ttp_template,
+        )
+
+    async def disconnect(self) -> None:
+        """Gracefully close the session (runs on the executor)."""
+        loop = asyncio.get_running_loop()
+        async with self._lock:
+            await loop.run_in_executor(self.executor, self.connection.disconnect)
+
+
+async def AsyncConnectHandler(
+    *args: Any, executor: Optional[Executor] = None, **kwargs: Any
+) -> AsyncConnection:
+    """Connect to the device on an executor and return an AsyncConnection.
+
+    Takes the same arguments as ConnectHandler. The executor bounds the number of
+    connection setups that run at the same time (defaults to the event loop's default
+    executor).
+    """
+    loop = asyncio.get_running_loop()
+    connection = await loop.run_in_executor(
+        executor, functools.partial(ConnectHandler, *args, **kwargs)
+    )
+    return AsyncConnection(connection, executor=executor)
@@ -18,6 +18,7 @@ from typing import (
     Type,
     Sequence,
     Iterator,
+    Generator,
     TextIO,
     Union,
     Tuple,
@@ -47,7 +48,6 @@ from netmiko.exceptions import (
     NetmikoTimeoutException,
     NetmikoAuthenticationException,
     ConfigInvalidException,
-    ReadException,
     ReadTimeout,
 )
 from netmiko._telnetlib import telnetlib
@@ -60,6 +60,9 @@ from netmiko.utilities import (
     run_ttp_template,
     select_cmd_verify,
     calc_old_timeout,
+    PatternSearch,
+    get_textfsm_parser,
+    TextFSMFeeder,
 )
 from netmiko.utilities import m_exec_time  # noqa
 from netmiko import telnet_proxy
@@ -77,6 +80,57 @@ max_loops in this context. You should remove any use of delay_factor=x
 from this method call.\n"""
 
 
+# ANSI (VT100) escape codes removed by strip_ansi_escape_codes(); see that method for details.
+# Every code has a fixed terminator so a single alternation is equivalent to removing the
+# codes one at a time.
+ANSI_ESCAPE_CODES = [
+    r"\[\d+;\d+H",  # Position cursor
+    r"\[\?25h",  # Show the cursor
+    r"\[2K",  # Erase entire line
+    r"\[\d+;\d+r",  # Enable scrolling from start to row end
+    r"\[K",  # Erase line from cursor to the end of line
+    r"\[1M",  # Carriage return
+    r"\[\?7l",  # Disable line wrapping
+    r"\[\?\d+l",  # Reset mode screen options
+    r"\[00m",  # Reset graphics mode
+    r"\[2J",  # Erase display
+    r"\[J",  # Erase display
+    r"\[\dm",  # Graphics mode
+    r"\[\d\d;\d\dm",  # Graphics mode
+    r"\[\d\d;\d\d;\d\dm",  # Graphics mode
+    r"\[(?:3|4)\dm",  # Graphics mode
+    r"\[(?:9|10)[0-7]m",  # Graphics mode
+    r"\[6n",  # Get cursor position
+    r"\[m",  # Cursor position
+    r"\[0m",  # Attributes off
+    r"\[7m",  # Reverse
+    r"\[\d+D",  # Move cursor left
+    r"\[\d*A",  # Move cursor up
+    r"\[\d*B",  # Move cursor down
+    r"\[\d*C",  # Move cursor forward
+    r"\[\?7h",  # Wrap around
+    r"\[\?2004h",  # Bracketed paste mode
+]
+ANSI_ESCAPE_RE = re.compile(chr(27) + "(?:" + "|".join(ANSI_ESCAPE_CODES) + ")")
+# ESC-E (next line) is substituted with a return
+ANSI_NEXT_LINE = chr(27) + "E"
+# Aruba and ProCurve switches can use insert_line for <enter>
+ANSI_INSERT_LINE_RE = re.compile(chr(27) + r"\[(\d+)L")
+
+# Shortest delay used when a wait is sized from the round trip time of the session (seconds)
+MIN_RTT_DELAY = 0.01
+
+# Last character of a complete prompt, used to stop waiting for the rest of the prompt early
+PROMPT_TERMINATORS = ("#", ">", "$", "%", "]")
+
+# base_prompt found by set_base_prompt() per (host, port, username, device_type), so that new
+# sessions to the same device can wait for that prompt instead of discovering it again.
+# At most BASE_PROMPT_CACHE_SIZE devices are kept (oldest dropped first), 0 disables the cache.
+BASE_PROMPT_CACHE: Dict[Tuple[str, int, str, str], str] = {}
+BASE_PROMPT_CACHE_SIZE = 1000
+_base_prompt_cache_lock = Lock()
+
+
 # Logging filter for #2597
 class SecretsFilter(logging.Filter):
     def __init__(self, no_log: Optional[Dict[Any, str]] = None) -> None:
@@ -485,15 +539,60 @@ class BaseConnection:
             # For SSH proxy support
             self.ssh_config_file = ssh_config_file
 
+        # Round trip time of the session in seconds, measured from the time it takes to get
+        # the first data back after a write (see read_until_pattern and find_prompt).
+        # None until measured.
+        self.rtt: Optional[float] = None
+        # Time of the last write when nothing was read since
+        self._last_write_time: Optional[float] = None
+        # Connection timings in seconds: establish_connection, session_preparation,
+        # connect_to_first_command and rtt
+        self.metrics: Dict[str, float] = {}
+        self._connect_start = time.time()
+
         # Establish the remote connection
         if auto_connect:
             self._open()
 
     def _open(self) -> None:
         """Decouple connection creation from __init__ for mocking."""
+        self._connect_start = time.time()
         self._modify_connection_params()
         self.establish_connection()
+        connected = time.time()
+        self.metrics["establish_connection"] = connected - self._connect_start
         self._try_session_preparation()
+        self.metrics["session_preparation"] = time.time() - connected
+
+    def _record_first_command(self) -> None:
+        """Record the time from the start of the connection to the first command sent."""
+        if "connect_to_first_command" in self.metrics:
+            return
+        # Commands sent during session_preparation don't count
+        if "session_preparation" not in self.metrics:
+            return
+        elapsed = time.time() - self._connect_start
+        self.metrics["connect_to_first_command"] = elapsed
+        log.info(f"{self.host}: connect to first command took {elapsed:.3f}s")
+
+    def _update_rtt(self, sample: float) -> None:
+        """Add a round trip time sample, smoothed as TCP does for its RTT (RFC 6298)."""
+        if self.rtt is None:
+            self.rtt = sample
+        else:
+            self.rtt = 0.875 * self.rtt + 0.125 * sample
+        self.metrics["rtt"] = self.rtt
+
+    def _rtt_delay(self, delay: float, factor: float = 4.0) -> float:
+        """Shorten delay to factor * RTT once the round trip time of the session is known.
+
+        :param delay: The fixed delay used as long as the RTT is unknown, and the maximum.
+
+        :param factor: Number of round trip times to wait.
+        """
+        if self.rtt is None:
+            return delay
+        return min(delay, max(factor * self.rtt, MIN_RTT_DELAY))
 
     def __enter__(self) -> "BaseConnection":
         """Establish a session using a Context Manager."""
@@ -586,6 +685,7 @@ key_file: {self.key_file}
         :type out_data: str
         """
         self.channel.write_channel(out_data)
+        self._last_write_time = time.time()
 
     def is_alive(self) -> bool:
         """Returns a boolean flag with the state of the connection."""
@@ -628,6 +728,9 @@ key_file: {self.key_file}
     def read_channel(self) -> str:
         """Generic handler that will read all the data from given channel."""
         new_data = self.channel.read_channel()
+        if new_data:
+            # The response to the last write has started
+            self._last_write_time = None
 
         if self.disable_lf_normalization is False:
             start = time.time()
@@ -687,55 +790,68 @@ You should convert all uses of max_loops over to read_timeout=x
 where x is the total number of seconds to wait before timing out.\n"""
             warnings.warn(msg, DeprecationWarning)
 
+        reader = self._pattern_reader(
+            pattern, read_timeout=read_timeout, re_flags=re_flags
+        )
+        try:
+            while True:
+                self.channel.wait_for_data(next(reader))
+        except StopIteration as stop:
+            output: str = stop.value
+            return output
+
+    def _pattern_reader(
+        self,
+        pattern: str,
+        read_timeout: float = 10.0,
+        re_flags: int = 0,
+        max_wait: float = 0.5,
+    ) -> Generator[float, None, str]:
+        """Read loop of read_until_pattern() without the waiting.
+
+        Yields the time to wait for new data when the channel is empty and returns the
+        output up to and including pattern. The caller does the waiting, so the same loop
+        is used by the blocking read_until_pattern() and by AsyncConnection.
+
+        :param max_wait: Maximum time to wait for new data before checking read_timeout.
+        """
         if self.read_timeout_override:
             read_timeout = self.read_timeout_override
 
         output = ""
-        loop_delay = 0.01
+        pattern_search = PatternSearch(pattern, re_flags=re_flags)
         start_time = time.time()
+        # Nothing was read since the last write: the first data we had to wait for is the
+        # response to that write (a round trip time sample).
+        write_time = None if self._read_buffer else self._last_write_time
+        waited = False
         # if read_timeout == 0 or 0.0 keep reading indefinitely
         while (time.time() - start_time < read_timeout) or (not read_timeout):
-            output += self.read_channel()
-
-            if re.search(pattern, output, flags=re_flags):
-                if "(" in pattern and "(?:" not in pattern:
-                    msg = f"""
-Parenthesis found in pattern.
-
-pattern: {pattern}\n
-
-This can be problemtic when used in read_until_pattern().
-
-You should ensure that you use either non-capture groups i.e. '(?:' or that the
-parenthesis completely wrap the pattern '(pattern)'"""
-                    log.debug(msg)
-                results = re.split(pattern, output, maxsplit=1, flags=re_flags)
-
-                # The string matched by pattern must be retained in the output string.
-                # re.split will do this if capturing parenthesis are used.
-                if len(results) == 2:
-                    # no capturing parenthesis, convert and try again.
-                    pattern = f"({pattern})"
-                    results = re.split(pattern, output, maxsplit=1, flags=re_flags)
-
-                if len(results) != 3:
-                    # well, we tried
-                    msg = f"""Unable to successfully split output based on pattern:
-pattern={pattern}
-output={repr(output)}
-results={results}
-"""
-                    raise ReadException(msg)
-
-                # Process such that everything before and including pattern is return.
+            new_data = self.read_channel()
+            if not new_data:
+                if read_timeout:
+                    remaining = read_timeout - (time.time() - start_time)
+                    wait_time = max(min(remaining, max_wait), 0)
+                else:
+                    wait_time = max_wait
+                yield wait_time
+                waited = True
+                continue
+            if write_time is not None and waited:
+                self._update_rtt(time.time() - write_time)
+                write_time = None
+
+            output += new_data
+            match = pattern_search.search(output)
+            if match:
+                # Everything before and including pattern is returned.
                 # Everything else is retained in the _read_buffer
-                output, match_str, buffer = results
-                output = output + match_str
+                buffer = output[match.end() :]
+                output = output[: match.end()]
                 if buffer:
                     self._read_buffer += buffer
                 log.debug(f"Pattern found: {pattern} {output}")
                 return output
-            time.sleep(loop_delay)
 
         msg = f"""\n\nPattern not detected: {repr(pattern)} in output.
 
@@ -986,7 +1102,8 @@ You can look at the Netmiko session_log or debug log for more information.
             # Netmiko needs there to be data for session_preparation to work.
             if force_data:
                 self.write_channel(self.RETURN)
-                time.sleep(0.1)
+                # Returns as soon as there is data to read (SSH)
+                self.channel.wait_for_data(0.1)
             self.session_preparation()
         except Exception:
             self.disconnect()
@@ -1237,7 +1354,8 @@ A paramiko SSHException occurred during connection creation:
             return self.read_until_pattern(pattern=pattern, read_timeout=20)
 
         main_delay = delay_factor * 0.1
-        time.sleep(main_delay * 10)
+        # Wait for the first data instead of sleeping a fixed delay
+        self.channel.wait_for_data(main_delay * 10)
         new_data = ""
         while i <= count:
             new_data += self.read_channel_timing(read_timeout=20)
@@ -1394,10 +1512,17 @@ A paramiko SSHException occurred during connection creation:
             elif alt_prompt_terminator:
                 pattern = re.escape(alt_prompt_terminator)
 
-        if pattern:
-            prompt = self.find_prompt(delay_factor=delay_factor, pattern=pattern)
-        else:
-            prompt = self.find_prompt(delay_factor=delay_factor)
+        cache_key = (self.host, self.port, self.username, self.device_type)
+        cached_base_prompt = BASE_PROMPT_CACHE.get(cache_key)
+        prompt = ""
+        if cached_base_prompt and pattern and BASE_PROMPT_CACHE_SIZE > 0:
+            prompt = self._find_cached_prompt(cached_base_prompt, pattern)
+
+        if not prompt:
+            if pattern:
+                prompt = self.find_prompt(delay_factor=delay_factor, pattern=pattern)
+            else:
+                prompt = self.find_prompt(delay_factor=delay_factor)
 
         if not prompt[-1] in (pri_prompt_terminator, alt_prompt_terminator):
             raise ValueError(f"Router prompt not found: {repr(prompt)}")
@@ -1408,8 +1533,46 @@ A paramiko SSHException occurred during connection creation:
         else:
             # Strip off trailing terminator
             self.base_prompt = prompt[:-1]
+        self._cache_base_prompt(cache_key)
         return self.base_prompt
 
+    def _cache_base_prompt(self, cache_key: Tuple[str, int, str, str]) -> None:
+        """Store base_prompt in BASE_PROMPT_CACHE, dropping the oldest entries over the limit."""
+        with _base_prompt_cache_lock:
+            BASE_PROMPT_CACHE.pop(cache_key, None)
+            if BASE_PROMPT_CACHE_SIZE <= 0:
+                return
+            BASE_PROMPT_CACHE[cache_key] = self.base_prompt
+            while len(BASE_PROMPT_CACHE) > BASE_PROMPT_CACHE_SIZE:
+                del BASE_PROMPT_CACHE[next(iter(BASE_PROMPT_CACHE))]
+
+    def _find_cached_prompt(self, base_prompt: str, pattern: str) -> str:
+        """Check that the device still shows the base_prompt found by a previous session.
+
+        Reading stops at the first output ending with a prompt terminator, which is compared
+        with the cached prompt. Returns "" right away if it is a different prompt (or nothing
+        was received), so find_prompt() can be used instead.
+
+        :param base_prompt: base_prompt from BASE_PROMPT_CACHE
+
+        :param pattern: Regular expression pattern matching the prompt terminator
+        """
+        self.clear_buffer()
+        self.write_channel(self.RETURN)
+        try:
+            output = self.read_until_pattern(
+                pattern=rf"(?:{pattern})[ \t]*$",
+                read_timeout=self._rtt_delay(2.0, factor=10.0),
+            )
+        except ReadTimeout:
+            return ""
+        prompt = output.split(self.RESPONSE_RETURN)[-1].strip()
+        if not re.fullmatch(rf"{re.escape(base_prompt)}(?:{pattern})", prompt):
+            log.debug(f"[_find_cached_prompt()]: cached prompt not found in {prompt}")
+            return ""
+        log.debug(f"[_find_cached_prompt()]: prompt is {prompt}")
+        return prompt
+
     def find_prompt(
         self, delay_factor: float = 1.0, pattern: Optional[str] = None
     ) -> str:
@@ -1429,15 +1592,13 @@ A paramiko SSHException occurred during connection creation:
             prompt = self.read_until_pattern(pattern=pattern)
         else:
             # Initial read
-            time.sleep(sleep_time)
-            prompt = self.read_channel().strip()
+            prompt = self._read_return_response(sleep_time).strip()
 
             count = 0
             while count <= 12 and not prompt:
                 if not prompt:
                     self.write_channel(self.RETURN)
-                    time.sleep(sleep_time)
-                    prompt = self.read_channel().strip()
+                    prompt = self._read_return_response(sleep_time).strip()
                     if sleep_time <= 3:
                         # Double the sleep_time when it is small
                         sleep_time *= 2
@@ -1454,6 +1615,49 @@ A paramiko SSHException occurred during connection creation:
         log.debug(f"[find_prompt()]: prompt is {prompt}")
         return prompt
 
+    def _read_return_response(self, timeout: float) -> str:
+        """Read the response to the RETURN that was just sent.
+
+        Waits up to timeout for the first data, the time it took is a round trip time sample.
+        Then keeps reading until no new data was received for a couple of round trip times
+        when the output ends with a prompt terminator, or for timeout otherwise (the prompt
+        may still be incomplete).
+
+        :param timeout: Maximum time to wait for the first data and for the rest of the prompt.
+        """
+        start_time = time.time()
+        write_time = None if self._read_buffer else self._last_write_time
+        output = self.read_channel()
+        if output:
+            # Data that was already there is not a response time
+            write_time = None
+        while not output:
+            remaining = start_time + timeout - time.time()
+            if remaining <= 0:
+                return ""
+            self.channel.wait_for_data(remaining)
+            output = self.read_channel()
+        if write_time is not None:
+            self._update_rtt(time.time() - write_time)
+
+        short_settle = self._rtt_delay(timeout, factor=2.0)
+        last_data = time.time()
+        deadline = last_data + 2 * timeout
+        while True:
+            if output.rstrip().endswith(PROMPT_TERMINATORS):
+                settle = short_settle
+            else:
+                settle = timeout
+            now = time.time()
+            if now - last_data >= settle or now >= deadline:
+                break
+            self.channel.wait_for_data(settle - (now - last_data))
+            new_data = self.read_channel()
+            if new_data:
+                output += new_data
+                last_data = time.time()
+        return output
+
     def clear_buffer(
         self,
         backoff: bool = True,
@@ -1464,7 +1668,8 @@ A paramiko SSHException occurred during connection creation:
 
         if delay_factor is None:
             delay_factor = self.global_delay_factor
-        sleep_time = 0.1 * delay_factor
+        max_sleep_time = 0.1 * delay_factor
+        sleep_time = self._rtt_delay(max_sleep_time)
 
         output = ""
         for _ in range(10):
@@ -1473,6 +1678,14 @@ A paramiko SSHException occurred during connection creation:
             data = self.strip_ansi_escape_codes(data)
             output += data
             if not data:
+                if (
+                    output
+                    and not output.rstrip().endswith(PROMPT_TERMINATORS)
+                    and sleep_time < max_sleep_time
+                ):
+                    # Partial prompt, the rest of it may still be on its way
+                    sleep_time = max_sleep_time
+                    continue
                 break
             # Double sleep time each time we detect data
             log.debug("Clear buffer detects data in the channel")
@@ -1561,6 +1774,7 @@ A paramiko SSHException occurred during connection creation:
         new_data = ""
         if normalize:
             command_string = self.normalize_cmd(command_string)
+        self._record_first_command()
         self.write_channel(command_string)
 
         cmd = command_string.strip()
@@ -1768,6 +1982,7 @@ before timing out.\n"""
 
         # Start the clock
         start_time = time.time()
+        self._record_first_command()
         self.write_channel(command_string)
         new_data = ""
 
@@ -1783,6 +1998,19 @@ before timing out.\n"""
         past_n_reads: Deque[str] = deque(maxlen=DEQUE_SIZE)
         first_line_processed = False
 
+        # Parse the output with TextFSM line by line while it is being read
+        textfsm_feeder = None
+        if use_textfsm:
+            fsm = get_textfsm_parser(
+                platform=self.device_type, command=cmd, template=textfsm_template
+            )
+            if fsm is not None:
+                textfsm_feeder = TextFSMFeeder(
+                    fsm,
+                    command=cmd if strip_command else "",
+                    response_return=self.RESPONSE_RETURN,
+                )
+
         # Keep reading data until search_pattern is found or until read_timeout
         while time.time() - start_time < read_timeout:
             if new_data:
@@ -1800,6 +2028,8 @@ before timing out.\n"""
                         break
 
                 else:
+                    if textfsm_feeder is not None:
+                        textfsm_feeder.feed(output)
                     if len(output) <= MAX_CHARS:
                         if re.search(search_pattern, output):
                             break
@@ -1825,12 +2055,17 @@ You can also look at the Netmiko session_log or debug log for more information.
 """
             raise ReadTimeout(msg)
 
+        raw_output = output
         output = self._sanitize_output(
             output,
             strip_command=strip_command,
             command_string=command_string,
             strip_prompt=strip_prompt,
         )
+        if textfsm_feeder is not None:
+            structured_output = textfsm_feeder.close(raw_output, output)
+            if structured_output is not None:
+                return structured_output
         return_val = structured_data_converter(
             command=command_string,
             raw_data=output,
@@ -2188,6 +2423,7 @@ You can also look at the Netmiko session_log or debug log for more information.
         error_pattern: str = "",
         terminator: str = r"#",
         bypass_commands: Optional[str] = None,
+        cmd_window: int = 1,
     ) -> str:
         """
         Send configuration commands down the SSH channel.
@@ -2226,6 +2462,9 @@ You can also look at the Netmiko session_log or debug log for more information.
 
         :param bypass_commands: Regular expression pattern indicating configuration commands
         where cmd_verify is automatically disabled.
+
+        :param cmd_window: Number of commands that can be written ahead of their verified
+        echo (pipelined mode when > 1). Only used when cmd_verify is True.
         """
 
         if self.global_cmd_verify is not None:
@@ -2265,6 +2504,8 @@ You can also look at the Netmiko session_log or debug log for more information.
         if not hasattr(config_commands, "__iter__"):
             raise ValueError("Invalid argument passed into send_config_set")
 
+        self._record_first_command()
+
         if bypass_commands is None:
             # Commands where cmd_verify is automatically disabled reg-ex logical-or
             bypass_commands = r"^banner .*$"
@@ -2311,6 +2552,48 @@ You can also look at the Netmiko session_log or debug log for more information.
             if not error_pattern:
                 output += self.read_channel_timing(read_timeout=read_timeout)
 
+        elif cmd_window > 1:
+            # Pipelined mode: keep up to cmd_window commands in flight and match their
+            # echoes in order as they come back. Whatever arrives between the echo of one
+            # command and the echo of the next belongs to the first command.
+            pending: Deque[str] = deque()
+            prev_cmd = None
+            for cmd in itertools.chain(config_commands, [None]):
+                if cmd is not None and not cmd.strip():
+                    # A blank command has no echo to wait for (an empty pattern would match
+                    # right away and shift the output of the following commands).
+                    continue
+                if cmd is not None:
+                    self.write_channel(self.normalize_cmd(cmd))
+                    pending.append(cmd)
+                    if len(pending) < cmd_window:
+                        continue
+                while pending:
+                    next_cmd = pending.popleft()
+                    new_output = self.read_until_pattern(
+                        pattern=re.escape(next_cmd.strip()), read_timeout=read_timeout
+                    )
+                    output += new_output
+                    if error_pattern and prev_cmd is not None:
+                        if re.search(error_pattern, new_output, flags=re.M):
+                            msg = f"Invalid input detected at command: {prev_cmd}"
+                            raise ConfigInvalidException(msg)
+                    prev_cmd = next_cmd
+                    if cmd is not None:
+                        break
+
+            if prev_cmd is not None:
+                # Read until final prompt or terminator (#)
+                pattern = f"(?:{re.escape(self.base_prompt)}.*$|{terminator}.*$)"
+                new_output = self.read_until_pattern(
+                    pattern=pattern, read_timeout=read_timeout, re_flags=re.M
+                )
+                output += new_output
+                if error_pattern:
+                    if re.search(error_pattern, new_output, flags=re.M):
+                        msg = f"Invalid input detected at command: {prev_cmd}"
+                        raise ConfigInvalidException(msg)
+
         else:
             for cmd in config_commands:
                 self.write_channel(self.normalize_cmd(cmd))
@@ -2370,80 +2653,21 @@ You can also look at the Netmiko session_log or debug log for more information.
         :type string_buffer: str
         """  # noqa
 
-        code_position_cursor = chr(27) + r"\[\d+;\d+H"
-        code_show_cursor = chr(27) + r"\[\?25h"
-        code_next_line = chr(27) + r"E"
-        code_erase_line_end = chr(27) + r"\[K"
-        code_erase_line = chr(27) + r"\[2K"
-        code_erase_start_line = chr(27) + r"\[K"
-        code_enable_scroll = chr(27) + r"\[\d+;\d+r"
-        code_insert_line = chr(27) + r"\[(\d+)L"
-        code_carriage_return = chr(27) + r"\[1M"
-        code_disable_line_wrapping = chr(27) + r"\[\?7l"
-        code_reset_mode_screen_options = chr(27) + r"\[\?\d+l"
-        code_reset_graphics_mode = chr(27) + r"\[00m"
-        code_erase_display = chr(27) + r"\[2J"
-        code_erase_display_0 = chr(27) + r"\[J"
-        code_graphics_mode = chr(27) + r"\[\dm"
-        code_graphics_mode1 = chr(27) + r"\[\d\d;\d\dm"
-        code_graphics_mode2 = chr(27) + r"\[\d\d;\d\d;\d\dm"
-        code_graphics_mode3 = chr(27) + r"\[(3|4)\dm"
-        code_graphics_mode4 = chr(27) + r"\[(9|10)[0-7]m"
-        code_get_cursor_position = chr(27) + r"\[6n"
-        code_cursor_position = chr(27) + r"\[m"
-        code_attrs_off = chr(27) + r"\[0m"
-        code_reverse = chr(27) + r"\[7m"
-        code_cursor_left = chr(27) + r"\[\d+D"
-        code_cursor_forward = chr(27) + r"\[\d*C"
-        code_cursor_up = chr(27) + r"\[\d*A"
-        code_cursor_down = chr(27) + r"\[\d*B"
-        code_wrap_around = chr(27) + r"\[\?7h"
-        code_bracketed_paste_mode = chr(27) + r"\[\?2004h"
-
-        code_set = [
-            code_position_cursor,
-            code_show_cursor,
-            code_erase_line,
-            code_enable_scroll,
-            code_erase_start_line,
-            code_carriage_return,
-            code_disable_line_wrapping,
-            code_erase_line_end,
-            code_reset_mode_screen_options,
-            code_reset_graphics_mode,
-            code_erase_display,
-            code_graphics_mode,
-            code_graphics_mode1,
-            code_graphics_mode2,
-            code_graphics_mode3,
-            code_graphics_mode4,
-            code_get_cursor_position,
-            code_cursor_position,
-            code_erase_display,
-            code_erase_display_0,
-            code_attrs_off,
-            code_reverse,
-            code_cursor_left,
-            code_cursor_up,
-            code_cursor_down,
-            code_cursor_forward,
-            code_wrap_around,
-            code_bracketed_paste_mode,
-        ]
-
-        output = string_buffer
-        for ansi_esc_code in code_set:
-            output = re.sub(ansi_esc_code, "", output)
+        # Fast path, nothing to strip
+        if chr(27) not in string_buffer:
+            return string_buffer
+
+        output = ANSI_ESCAPE_RE.sub("", string_buffer)
 
         # CODE_NEXT_LINE must substitute with return
-        output = re.sub(code_next_line, self.RETURN, output)
+        output = output.replace(ANSI_NEXT_LINE, self.RETURN)
 
         # Aruba and ProCurve switches can use code_insert_line for <enter>
-        insert_line_match = re.search(code_insert_line, output)
+        insert_line_match = ANSI_INSERT_LINE_RE.search(output)
         if insert_line_match:
             # Substitute each insert_line with a new <enter>
             count = int(insert_line_match.group(1))
-            output = re.sub(code_insert_line, count * self.RETURN, output)
+            output = ANSI_INSERT_LINE_RE.sub(count * self.RETURN, output)
 
         return output
 
@@ -1,5 +1,8 @@
 from typing import Any, Optional
 from abc import ABC, abstractmethod
+import codecs
+import select
+import time
 import paramiko
 import serial
 
@@ -50,6 +53,16 @@ class Channel(ABC):
         """Write data down the channel."""
         pass
 
+    def wait_for_data(self, timeout: float) -> bool:
+        """Block until data is available to be read or until timeout expires.
+
+        Channels without a readiness notification fall back to a short polling delay.
+
+        Returns True if data might be available to be read.
+        """
+        time.sleep(min(timeout, 0.01))
+        return True
+
     # @abstractmethod
     # def is_alive(self) -> bool:
     #     """Is the channel alive."""
@@ -65,6 +78,8 @@ class SSHChannel(Channel):
         self.remote_conn = conn
         # FIX: move encoding to GlobalState object?
         self.encoding = encoding
+        # Incremental decoder keeps multibyte characters split across reads intact
+        self._decoder = codecs.getincrementaldecoder(encoding)("ignore")
 
     def write_channel(self, out_data: str) -> None:
         if self.remote_conn is None:
@@ -73,29 +88,48 @@ class SSHChannel(Channel):
             )
         self.remote_conn.sendall(write_bytes(out_data, encoding=self.encoding))
 
-    def read_buffer(self) -> str:
-        """Single read of available data."""
+    def _recv_buffer(self) -> bytes:
+        """Single read of available raw data."""
         if self.remote_conn is None:
             raise ReadException("Attempt to read, but there is no active channel.")
-        output = ""
         if self.remote_conn.recv_ready():
             outbuf = self.remote_conn.recv(MAX_BUFFER)
             if len(outbuf) == 0:
                 raise ReadException("Channel stream closed by remote device.")
-            output += outbuf.decode(self.encoding, "ignore")
-        return output
+            return outbuf
+        return b""
+
+    def read_buffer(self) -> str:
+        """Single read of available data."""
+        return self._decoder.decode(self._recv_buffer())
 
     def read_channel(self) -> str:
         """Read all of the available data from the channel."""
         if self.remote_conn is None:
             raise ReadException("Attempt to read, but there is no active channel.")
-        output = ""
+        # Collect the raw bytes and only decode once
+        output = bytearray()
         while True:
-            new_output = self.read_buffer()
-            output += new_output
-            if new_output == "":
+            new_output = self._recv_buffer()
+            if not new_output:
                 break
-        return output
+            output += new_output
+        return self._decoder.decode(output)
+
+    def wait_for_data(self, timeout: float) -> bool:
+        """Block on the paramiko channel's readiness event instead of polling."""
+        if self.remote_conn is None:
+            raise ReadException("Attempt to read, but there is no active channel.")
+        if self.remote_conn.recv_ready():
+            return True
+        if self.remote_conn.closed or self.remote_conn.eof_received:
+            # A closed channel is always 'readable'; don't spin on it.
+            time.sleep(timeout)
+            return False
+        # paramiko.Channel.fileno() is backed by an OS pipe that becomes readable when
+        # data is fed into the channel's receive buffer.
+        readable, _, _ = select.select([self.remote_conn], [], [], timeout)
+        return bool(readable)
 
 
 class TelnetChannel(Channel):
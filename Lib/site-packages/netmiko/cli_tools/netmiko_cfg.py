@@ -7,12 +7,7 @@ import argparse
 import sys
 import os
 import subprocess
-import threading
-
-try:
-    from Queue import Queue
-except ImportError:
-    from queue import Queue
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
 from datetime import datetime
 from getpass import getpass
 
@@ -28,6 +23,7 @@ if not os.path.exists(GREP):
     GREP = "/usr/bin/grep"
 NETMIKO_BASE_DIR = "~/.netmiko"
 ERROR_PATTERN = "%%%failed%%%"
+DEFAULT_WORKERS = 50
 __version__ = "0.1.0"
 
 PY2 = sys.version_info.major == 2
@@ -61,7 +57,7 @@ def grepx(files, pattern, grep_options, use_colors=True):
     return ""
 
 
-def ssh_conn(device_name, a_device, cfg_command, output_q):
+def ssh_conn(device_name, a_device, cfg_command, output_q=None):
     try:
         net_connect = ConnectHandler(**a_device)
         net_connect.enable()
@@ -71,7 +67,10 @@ def ssh_conn(device_name, a_device, cfg_command, output_q):
         net_connect.disconnect()
     except Exception:
         output = ERROR_PATTERN
-    output_q.put({device_name: output})
+    result = {device_name: output}
+    if output_q is not None:
+        output_q.put(result)
+    return result
 
 
 def parse_arguments(args):
@@ -107,6 +106,13 @@ def parse_arguments(args):
     parser.add_argument(
         "--hide-failed", help="Hide failed devices", action="store_true"
     )
+    parser.add_argument(
+        "--workers",
+        help="Maximum number of devices to connect to at the same time",
+        action="store",
+        default=DEFAULT_WORKERS,
+        type=int,
+    )
     parser.add_argument("--version", help="Display version", action="store_true")
     cli_args = parser.parse_args(args)
     if not cli_args.list_devices and not cli_args.version:
@@ -157,7 +163,6 @@ def main(args):
     pattern = r"."
     hide_failed = cli_args.hide_failed
 
-    output_q = Queue()
     my_devices = load_devices()
     if device_or_group == "all":
         device_group = obtain_all_devices(my_devices)
@@ -179,36 +184,41 @@ def main(args):
     # Retrieve output from devices
     my_files = []
     failed_devices = []
-    for device_name, a_device in device_group.items():
-        if cli_username:
-            a_device["username"] = cli_username
-        if cli_password:
-            a_device["password"] = cli_password
-        if cli_secret:
-            a_device["secret"] = cli_secret
-        if not cmd_arg:
-            cli_command = SHOW_RUN_MAPPER.get(a_device["device_type"], "show run")
-        my_thread = threading.Thread(
-            target=ssh_conn, args=(device_name, a_device, cli_command, output_q)
-        )
-        my_thread.start()
-    # Make sure all threads have finished
-    main_thread = threading.current_thread()
-    for some_thread in threading.enumerate():
-        if some_thread != main_thread:
-            some_thread.join()
-    # Write files
-    while not output_q.empty():
-        my_dict = output_q.get()
-        netmiko_base_dir, netmiko_full_dir = find_netmiko_dir()
-        ensure_dir_exists(netmiko_base_dir)
-        ensure_dir_exists(netmiko_full_dir)
-        for device_name, output in my_dict.items():
-            file_name = write_tmp_file(device_name, output)
-            if ERROR_PATTERN not in output:
-                my_files.append(file_name)
-            else:
-                failed_devices.append(device_name)
+    netmiko_base_dir, netmiko_full_dir = find_netmiko_dir()
+    ensure_dir_exists(netmiko_base_dir)
+    ensure_dir_exists(netmiko_full_dir)
+    # Bounded worker pool; each result is written out as soon as it arrives
+    with ThreadPoolExecutor(max_workers=max(cli_args.workers, 1)) as executor:
+        # Only the futures still running are kept, so finished output can be freed
+        pending = set()
+        for device_name, a_device in device_group.items():
+            if cli_username:
+                a_device["username"] = cli_username
+            if cli_password:
+                a_device["password"] = cli_password
+            if cli_secret:
+                a_device["secret"] = cli_secret
+            if not cmd_arg:
+                cli_command = SHOW_RUN_MAPPER.get(a_device["device_type"], "show run")
+            pending.add(
+                executor.submit(ssh_conn, device_name, a_device, cli_command)
+            )
+        total = len(pending)
+        count = 0
+        while pending:
+            done, pending = wait(pending, return_when=FIRST_COMPLETED)
+            while done:
+                count += 1
+                for device_name, output in done.pop().result().items():
+                    file_name = write_tmp_file(device_name, output)
+                    if ERROR_PATTERN not in output:
+                        my_files.append(file_name)
+                    else:
+                        failed_devices.append(device_name)
+                    print(
+                        "[{}/{}] {}".format(count, total, device_name),
+                        file=sys.stderr,
+                    )
 
     grep_options = []
     grepx(my_files, pattern, grep_options)
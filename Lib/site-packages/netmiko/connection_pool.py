@@ -0,0 +1,298 @@
+"""Pool of Netmiko connections that are kept open and reused between jobs.
+
+Opening a Netmiko connection costs TCP and SSH setup, authentication, session_preparation
+(disable paging, set_base_prompt...). Jobs that run often against the same devices (e.g.
+polling every minute) can take their connection from a ConnectionPool instead, and give it
+back when they are done, so the next job reuses the same session.
+
+Sessions are pooled per (host, port, username, device_type). SSH keepalives keep idle
+sessions open, and each idle session is checked with is_alive() before it is handed out
+again. When a job gives a session back, the pool checks that the prompt is the same as when
+the session was opened (exit_config_mode() is called if needed). Sessions that fail any of
+these checks are closed. Idle sessions older than max_idle_time are closed, and the least
+recently used ones are closed once there are more than max_idle_sessions. There is no
+background thread: idle sessions are only swept by acquire(), release() and evict_idle(), call
+evict_idle() periodically if the pool can stay unused for a long time. At most
+max_sessions_per_device sessions are opened to the same device (vty lines are limited), jobs
+wait for one of them to be given back.
+
+Example:
+
+    pool = ConnectionPool(max_sessions_per_device=2)
+    with pool.connection(**device) as conn:
+        output = conn.send_command("show version")
+    ...
+    pool.close()
+"""
+
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+from types import TracebackType
+from collections import OrderedDict
+from contextlib import contextmanager
+import threading
+import time
+
+from netmiko import log
+from netmiko.base_connection import BaseConnection
+from netmiko.exceptions import ConnectionException
+from netmiko.ssh_dispatcher import ConnectHandler
+
+PoolKey = Tuple[str, int, str, str]
+
+
+class ConnectionPool:
+    def __init__(
+        self,
+        max_sessions_per_device: int = 2,
+        max_idle_time: float = 300.0,
+        max_idle_sessions: int = 100,
+        wait_timeout: float = 60.0,
+        keepalive: int = 30,
+    ) -> None:
+        """
+        Keep Netmiko connections open and hand them out again to later jobs.
+
+        :param max_sessions_per_device: Maximum number of sessions (idle or in use) to the
+            same device.
+
+        :param max_idle_time: Idle sessions are closed after this many seconds.
+
+        :param max_idle_sessions: Maximum number of idle sessions (all devices), the least
+            recently used ones are closed first.
+
+        :param wait_timeout: Maximum time acquire() waits for a session to a device that
+            already has max_sessions_per_device sessions. Raises ConnectionException.
+
+        :param keepalive: SSH keepalive interval used for the pooled connections, unless the
+            device arguments set their own keepalive.
+        """
+        self.max_sessions_per_device = max_sessions_per_device
+        self.max_idle_time = max_idle_time
+        self.max_idle_sessions = max_idle_sessions
+        self.wait_timeout = wait_timeout
+        self.keepalive = keepalive
+
+        self._lock = threading.Condition()
+        # id(connection) -> (key, connection, time given back), least recently used first
+        self._idle: "OrderedDict[int, Tuple[PoolKey, BaseConnection, float]]" = (
+            OrderedDict()
+        )
+        # id(connection) -> key, for the sessions handed out
+        self._in_use: Dict[int, PoolKey] = {}
+        # Sessions per key: idle, in use and being opened
+        self._sessions: Dict[PoolKey, int] = {}
+        # id(connection) -> prompt the session must be returned with
+        self._prompts: Dict[int, str] = {}
+        self._closed = False
+
+    def __repr__(self) -> str:
+        with self._lock:
+            return (
+                f"{self.__class__.__name__}(idle={len(self._idle)}, "
+                f"in_use={len(self._in_use)})"
+            )
+
+    def __enter__(self) -> "ConnectionPool":
+        return self
+
+    def __exit__(
+        self,
+        exc_type: Optional[type],
+        exc_value: Optional[BaseException],
+        traceback: Optional[TracebackType],
+    ) -> None:
+        self.close()
+
+    @staticmethod
+    def pool_key(device: Dict[str, Any]) -> PoolKey:
+        """Return the (host, port, username, device_type) key of the device arguments."""
+        host = (device.get("host") or device.get("ip") or "").strip()
+        device_type = device["device_type"]
+        port = device.get("port")
+        if port is None:
+            # Same default port as BaseConnection
+            port = 23 if "telnet" in device_type else 22
+        return (host, int(port), device.get("username", ""), device_type)
+
+    @contextmanager
+    def connection(self, **device: Any) -> Iterator[BaseConnection]:
+        """Context manager around acquire() and release().
+
+        The session is closed instead of being given back if the block raises an exception
+        (the channel may be out of sync).
+        """
+        conn = self.acquire(**device)
+        try:
+            yield conn
+        except BaseException:
+            self.release(conn, discard=True)
+            raise
+        self.release(conn)
+
+    def acquire(self, **device: Any) -> BaseConnection:
+        """Return a connection to the device, reusing an idle session when possible.
+
+        Takes the same arguments as ConnectHandler. The connection must be given back with
+        release().
+        """
+        key = self.pool_key(device)
+        deadline = time.time() + self.wait_timeout
+        while True:
+            can_open = False
+            with self._lock:
+                if self._closed:
+                    raise ConnectionException("ConnectionPool is closed")
+                expired = self._pop_expired()
+                conn = self._pop_idle(key)
+                if conn is None and not expired:
+                    if self._sessions.get(key, 0) < self.max_sessions_per_device:
+                        self._sessions[key] = self._sessions.get(key, 0) + 1
+                        can_open = True
+                    else:
+                        remaining = deadline - time.time()
+                        if remaining <= 0:
+                            msg = (
+                                f"Timed out waiting for a session to {key[0]}, "
+                                f"{self.max_sessions_per_device} sessions already open"
+                            )
+                            raise ConnectionException(msg)
+                        self._lock.wait(remaining)
+                        continue
+            # Expired sessions might have freed a slot, look again once they are closed
+            self._disconnect(expired)
+
+            if conn is not None:
+                if self._check_idle(conn):
+                    with self._lock:
+                        self._in_use[id(conn)] = key
+                    return conn
+                self._discard(key, conn)
+            elif can_open:
+                return self._open(key, device)
+
+    def release(self, conn: BaseConnection, discard: bool = False) -> None:
+        """Give a connection back to the pool.
+
+        :param discard: Close the session instead of keeping it for reuse.
+        """
+        with self._lock:
+            key = self._in_use.pop(id(conn), None)
+        if key is None:
+            raise ValueError("Connection was not acquired from this ConnectionPool")
+
+        if not discard and not self._closed:
+            discard = not self._check_released(conn)
+        if discard or self._closed:
+            self._discard(key, conn)
+            return
+
+        with self._lock:
+            self._idle[id(conn)] = (key, conn, time.time())
+            to_close = self._pop_expired()
+            while len(self._idle) > self.max_idle_sessions:
+                lru_key, lru_conn, _ = self._idle.popitem(last=False)[1]
+                self._forget(lru_key, lru_conn)
+                to_close.append(lru_conn)
+            self._lock.notify_all()
+        self._disconnect(to_close)
+
+    def evict_idle(self) -> None:
+        """Close the idle sessions that exceeded max_idle_time."""
+        with self._lock:
+            expired = self._pop_expired()
+        self._disconnect(expired)
+
+    def close(self) -> None:
+        """Close all idle sessions. Sessions in use are closed when they are released."""
+        with self._lock:
+            self._closed = True
+            idle = list(self._idle.values())
+            self._idle.clear()
+            for key, conn, _ in idle:
+                self._forget(key, conn)
+            self._lock.notify_all()
+        self._disconnect([conn for _, conn, _ in idle])
+
+    def _open(self, key: PoolKey, device: Dict[str, Any]) -> BaseConnection:
+        """Open a new session, a slot for it is already counted in _sessions."""
+        kwargs = dict(device)
+        kwargs.setdefault("keepalive", self.keepalive)
+        try:
+            conn = ConnectHandler(**kwargs)
+            prompt = conn.find_prompt()
+        except BaseException:
+            with self._lock:
+                self._sessions[key] -= 1
+                self._lock.notify_all()
+            raise
+        with self._lock:
+            self._prompts[id(conn)] = prompt
+            self._in_use[id(conn)] = key
+        log.debug(f"ConnectionPool: new session to {key[0]}")
+        return conn
+
+    def _pop_idle(self, key: PoolKey) -> Optional[BaseConnection]:
+        """Take the most recently used idle session for key (called with the lock held)."""
+        for conn_id in reversed(self._idle):
+            if self._idle[conn_id][0] == key:
+                return self._idle.pop(conn_id)[1]
+        return None
+
+    def _pop_expired(self) -> List[BaseConnection]:
+        """Remove the idle sessions older than max_idle_time (called with the lock held)."""
+        expired = []
+        oldest = time.time() - self.max_idle_time
+        for conn_id, (key, conn, released) in list(self._idle.items()):
+            # _idle is kept in release order
+            if released > oldest:
+                break
+            del self._idle[conn_id]
+            self._forget(key, conn)
+            expired.append(conn)
+        return expired
+
+    def _forget(self, key: PoolKey, conn: BaseConnection) -> None:
+        """Stop counting a session (called with the lock held)."""
+        self._prompts.pop(id(conn), None)
+        self._sessions[key] -= 1
+        if not self._sessions[key]:
+            del self._sessions[key]
+        self._lock.notify_all()
+
+    def _discard(self, key: PoolKey, conn: BaseConnection) -> None:
+        with self._lock:
+            self._forget(key, conn)
+        self._disconnect([conn])
+
+    @staticmethod
+    def _disconnect(conns: List[BaseConnection]) -> None:
+        for conn in conns:
+            log.debug(f"ConnectionPool: closing session to {conn.host}")
+            conn.disconnect()
+
+    def _check_idle(self, conn: BaseConnection) -> bool:
+        """Health check of an idle session before it is handed out."""
+        try:
+            if not conn.is_alive():
+                return False
+            # Drop anything received while idle (e.g. logging messages)
+            conn.clear_buffer(backoff=False)
+            return True
+        except Exception:
+            log.debug("ConnectionPool: idle session failed", exc_info=True)
+            return False
+
+    def _check_released(self, conn: BaseConnection) -> bool:
+        """Make sure a session given back is at the prompt it was opened with."""
+        try:
+            expected_prompt = self._prompts.get(id(conn))
+            if conn.find_prompt() != expected_prompt:
+                # Leave configuration mode, any other mode change closes the session
+                conn.exit_config_mode()
+                if conn.find_prompt() != expected_prompt:
+                    log.debug("ConnectionPool: released session is in another mode")
+                    return False
+            return True
+        except Exception:
+            log.debug("ConnectionPool: released session failed", exc_info=True)
+            return False
@@ -6,15 +6,18 @@ Supports file get and file put operations.
 SCP requires a separate SSH connection for a control channel.
 """
 
-from typing import AnyStr, Optional, Callable, Any, Dict
+from typing import AnyStr, Optional, Callable, Any, Dict, Iterable, Union
 from typing import TYPE_CHECKING
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from netmiko.scp_handler import BaseFileTransfer
-from netmiko.ssh_dispatcher import FileTransfer
+from netmiko.ssh_dispatcher import ConnectHandler, FileTransfer
 from netmiko.cisco.cisco_ios import InLineTransfer
 
 if TYPE_CHECKING:
     from netmiko.base_connection import BaseConnection
 
+DEFAULT_TRANSFER_WORKERS = 10
+
 
 def progress_bar(
     filename: AnyStr, size: int, sent: int, peername: Optional[str] = None
@@ -156,3 +159,46 @@ def file_transfer(
                     raise ValueError("MD5 failure between source and destination files")
             else:
                 return transferred_and_notverified
+
+
+def _connect_and_transfer(
+    device: Dict[str, Any], source_file: str, dest_file: str, **kwargs: Any
+) -> Dict[str, bool]:
+    with ConnectHandler(**device) as ssh_conn:
+        return file_transfer(ssh_conn, source_file, dest_file, **kwargs)
+
+
+def file_transfer_many(
+    devices: Iterable[Dict[str, Any]],
+    source_file: str,
+    dest_file: str,
+    max_workers: int = DEFAULT_TRANSFER_WORKERS,
+    **kwargs: Any,
+) -> Dict[str, Union[Dict[str, bool], Exception]]:
+    """Transfer the same file to/from many network devices in parallel.
+
+    devices are ConnectHandler arguments, kwargs are passed on to file_transfer().
+    At most max_workers devices are connected and transferring at the same time.
+    The local MD5 of source_file is only computed once for all devices, devices
+    where the file exists with a matching MD5 are not transferred again (see
+    file_transfer).
+
+    return {
+        'host': file_transfer() result dictionary or the exception that was raised,
+    }
+    """
+    results: Dict[str, Union[Dict[str, bool], Exception]] = {}
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        futures = {
+            executor.submit(
+                _connect_and_transfer, device, source_file, dest_file, **kwargs
+            ): device.get("host") or device.get("ip", "")
+            for device in devices
+        }
+        for future in as_completed(futures):
+            host = futures[future]
+            try:
+                results[host] = future.result()
+            except Exception as e:
+                results[host] = e
+    return results
@@ -6,19 +6,70 @@ Supports file get and file put operations.
 SCP requires a separate SSH connection for a control channel.
 """
 
-from typing import Callable, Optional, Any, Type
+from typing import Callable, Optional, Any, Type, Tuple, BinaryIO
 from typing import TYPE_CHECKING
 from types import TracebackType
+import functools
 import re
 import os
 import hashlib
+import threading
 
 import scp
 import sys
 
+from netmiko import log
+
 if TYPE_CHECKING:
     from netmiko.base_connection import BaseConnection
 
+# Size of the reads from (and writes to the channel of) the local file
+SCP_BUFF_SIZE = 256 * 1024
+MD5_READ_SIZE = 1024 * 1024
+# Only hash a local file once when many transfers of it start at the same time. The locks
+# are picked by path so that transfers of different files hash them in parallel.
+_local_md5_locks = [threading.Lock() for _ in range(32)]
+
+
+@functools.lru_cache(maxsize=32)
+def _local_file_md5(file_name: str, file_stat: Tuple[int, int]) -> str:
+    """MD5 of a local file; file_stat (size, mtime) invalidates changed files."""
+    file_hash = hashlib.md5()
+    with open(file_name, "rb") as f:
+        while True:
+            file_contents = f.read(MD5_READ_SIZE)
+            if not file_contents:
+                break
+            file_hash.update(file_contents)
+    return file_hash.hexdigest()
+
+
+class _MD5Reader(object):
+    """File wrapper that computes the MD5 of the data as it is read."""
+
+    def __init__(self, fl: BinaryIO) -> None:
+        self.fl = fl
+        self.file_hash = hashlib.md5()
+
+    def read(self, size: int = -1) -> bytes:
+        data = self.fl.read(size)
+        self.file_hash.update(data)
+        return data
+
+    def tell(self) -> int:
+        return self.fl.tell()
+
+
+class MD5SCPClient(scp.SCPClient):
+    """SCPClient that computes the MD5 of each file it puts while sending it."""
+
+    sent_md5: Optional[str] = None
+
+    def _send_file(self, fl: BinaryIO, name: Any, mode: str, size: int) -> None:
+        reader = _MD5Reader(fl)
+        super()._send_file(reader, name, mode, size)
+        self.sent_md5 = reader.file_hash.hexdigest()
+
 
 class SCPConn(object):
     """
@@ -33,11 +84,13 @@ class SCPConn(object):
         socket_timeout: float = 10.0,
         progress: Optional[Callable[..., Any]] = None,
         progress4: Optional[Callable[..., Any]] = None,
+        buff_size: int = SCP_BUFF_SIZE,
     ) -> None:
         self.ssh_ctl_chan = ssh_conn
         self.socket_timeout = socket_timeout
         self.progress = progress
         self.progress4 = progress4
+        self.buff_size = buff_size
         self.establish_scp_conn()
 
     def establish_scp_conn(self) -> None:
@@ -45,8 +98,9 @@ class SCPConn(object):
         ssh_connect_params = self.ssh_ctl_chan._connect_params_dict()
         self.scp_conn = self.ssh_ctl_chan._build_ssh_client()
         self.scp_conn.connect(**ssh_connect_params)
-        self.scp_client = scp.SCPClient(
+        self.scp_client = MD5SCPClient(
             self.scp_conn.get_transport(),
+            buff_size=self.buff_size,
             socket_timeout=self.socket_timeout,
             progress=self.progress,
             progress4=self.progress4,
@@ -57,7 +111,17 @@ class SCPConn(object):
         self.scp_client.put(source_file, dest_file)
 
     def scp_get_file(self, source_file: str, dest_file: str) -> None:
-        """Get file using SCP."""
+        """Get file using SCP.
+
+        A download of dest_file that was interrupted (on this or an earlier connection) is
+        resumed over SFTP when the device supports it, otherwise the whole file is copied.
+        """
+        if scp.partial_download(dest_file) is not None:
+            try:
+                self.scp_client.resume_get(source_file, dest_file)
+                return
+            except scp.SCPException as e:
+                log.debug(f"Cannot resume the download of {dest_file}: {e}")
         self.scp_client.get(source_file, dest_file)
 
     def scp_put_file(self, source_file: str, dest_file: str) -> None:
@@ -106,7 +170,10 @@ class BaseFileTransfer(object):
             self.file_system = file_system
 
         if direction == "put":
-            self.source_md5 = self.file_md5(source_file) if hash_supported else None
+            # Computed on first use, if the file is sent before then the MD5 is
+            # taken from the data that was sent (no separate pass over the file).
+            self.source_md5 = None
+            self._source_md5_pending = hash_supported
             self.file_size = os.stat(source_file).st_size
         elif direction == "get":
             self.source_md5 = (
@@ -116,6 +183,18 @@ class BaseFileTransfer(object):
         else:
             raise ValueError("Invalid direction specified")
 
+    @property
+    def source_md5(self) -> Optional[str]:
+        if getattr(self, "_source_md5_pending", False):
+            self._source_md5_pending = False
+            self._source_md5 = self.file_md5(self.source_file)
+        return self._source_md5
+
+    @source_md5.setter
+    def source_md5(self, value: Optional[str]) -> None:
+        self._source_md5_pending = False
+        self._source_md5 = value
+
     def __enter__(self) -> "BaseFileTransfer":
         """Context manager setup"""
         self.establish_scp_conn()
@@ -334,16 +413,12 @@ class BaseFileTransfer(object):
           add_newline: add newline to end of file contents or not
 
         """
-        file_hash = hashlib.md5()
-        with open(file_name, "rb") as f:
-            while True:
-                file_contents = f.read(512)
-                if not file_contents:
-                    if add_newline:
-                        file_contents + b"\n"
-                    break
-                file_hash.update(file_contents)
-        return file_hash.hexdigest()
+        file_name = os.path.abspath(file_name)
+        file_stat = os.stat(file_name)
+        with _local_md5_locks[hash(file_name) % len(_local_md5_locks)]:
+            return _local_file_md5(
+                file_name, (file_stat.st_size, file_stat.st_mtime_ns)
+            )
 
     @staticmethod
     def process_md5(md5_output: str, pattern: str = r"=\s+(\S+)") -> str:
@@ -409,6 +484,11 @@ class BaseFileTransfer(object):
         self.scp_conn.scp_transfer_file(self.source_file, destination)
         # Must close the SCP connection to get the file written (flush)
         self.scp_conn.close()
+        if (
+            getattr(self, "_source_md5_pending", False)
+            and type(self).file_md5 is BaseFileTransfer.file_md5
+        ):
+            self.source_md5 = self.scp_conn.scp_client.sent_md5
 
     def verify_file(self) -> bool:
         """Verify the file has been transferred correctly."""
@@ -1,6 +1,6 @@
 import io
 from netmiko.utilities import write_bytes
-from typing import Dict, Any, Union, Optional, TextIO
+from typing import Dict, Any, Union, Optional, TextIO, Tuple
 
 
 class SessionLog:
@@ -13,6 +13,7 @@ class SessionLog:
         no_log: Optional[Dict[str, Any]] = None,
         record_writes: bool = False,
         slog_buffer: Optional[io.StringIO] = None,
+        chunk_size: int = 65536,
     ) -> None:
         if no_log is None:
             self.no_log = {}
@@ -31,12 +32,15 @@ class SessionLog:
         else:
             self.session_log = None
 
-        # In order to ensure all the no_log entries get hidden properly,
-        # we must first store everying in memory and then write out to file.
-        # Otherwise, we might miss the data we are supposed to hide (since
-        # the no_log data potentially spans multiple reads).
+        # Data is buffered in memory and written out in chunks of chunk_size. In
+        # order to ensure all the no_log entries get hidden properly, the tail of
+        # each chunk that could be the start of no_log data is kept in the buffer
+        # (since the no_log data potentially spans multiple reads).
         if slog_buffer is None:
             self.slog_buffer = io.StringIO()
+        else:
+            self.slog_buffer = slog_buffer
+        self.chunk_size = chunk_size
 
         # Ensures last write operations prior to disconnect are recorded.
         self.fin = False
@@ -75,11 +79,40 @@ class SessionLog:
         self.slog_buffer = io.StringIO()
         return data
 
-    def flush(self) -> None:
-        """Force the slog_buffer to be written out to the actual file"""
+    def _split_overlap(self, data: str) -> Tuple[str, str]:
+        """Split data into a part that is safe to filter and a tail to keep buffered.
+
+        The tail is the longest suffix that could be the start of no_log data. It is
+        shortened so that no no_log entry straddles the split point.
+        """
+        hidden = [hidden_data for hidden_data in self.no_log.values() if hidden_data]
+        if not hidden:
+            return data, ""
+        overlap = max(len(hidden_data) for hidden_data in hidden) - 1
+        split = max(len(data) - overlap, 0)
+        moved = True
+        while moved:
+            moved = False
+            for hidden_data in hidden:
+                # Last entry that starts before the split point
+                start = data.rfind(hidden_data, 0, split + len(hidden_data) - 1)
+                if start != -1 and start < split < start + len(hidden_data):
+                    split = start
+                    moved = True
+        return data[:split], data[split:]
+
+    def flush(self, partial: bool = False) -> None:
+        """Force the slog_buffer to be written out to the actual file
+
+        :param partial: Keep the tail that could contain the start of no_log data in the
+            slog_buffer (used when flushing chunks while the session is still active).
+        """
 
         if self.session_log is not None:
             data = self._read_buffer()
+            if partial:
+                data, tail = self._split_overlap(data)
+                self.slog_buffer.write(tail)
             data = self.no_log_filter(data)
 
             if isinstance(self.session_log, io.BufferedIOBase):
@@ -97,3 +130,6 @@ class SessionLog:
     def write(self, data: str) -> None:
         if len(data) > 0:
             self.slog_buffer.write(data)
+            # Keep memory bounded on long sessions by writing out full chunks
+            if self.slog_buffer.tell() >= self.chunk_size:
+                self.flush(partial=True)
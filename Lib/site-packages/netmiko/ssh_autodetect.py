@@ -19,6 +19,15 @@ to handle the auto-detection.
 * "priority" : An integer (0-99) which specifies the confidence of the match above
 * "dispatch" : The function to call to try the autodetection (per default SSHDetect._autodetect_std)
 
+Before any command is sent, the SSH server version, the pre-authentication banner and the text
+shown after login (MOTD and prompt) are checked against *SSH_BANNER_MAPPER*. A match with a
+priority of 99 in the SSH server version or the prompt ends the detection without probing.
+Other matches (the banner and MOTD are free text) only move the matching device_types to the
+front of the probe order.
+
+*autodetect_many* runs the detection for many devices in parallel and can keep the results in
+a JSON cache file keyed by SSH host key fingerprint, so known devices are not detected again.
+
 Examples
 --------
 
@@ -37,10 +46,20 @@ Examples
 # Netmiko connection creation section
 >>> remote_device['device_type'] = best_match
 >>> connection = ConnectHandler(**remote_device)
+
+# Parallel auto-detection with a result cache
+>>> from netmiko.ssh_autodetect import autodetect_many
+>>> results = autodetect_many(devices, cache_file='autodetect_cache.json')
+>>> print(results) # {'host': device_type, None or the exception raised}
 """
 
-from typing import Any, List, Optional, Union, Dict
+from typing import Any, List, Optional, Union, Dict, Iterable, Tuple
+from concurrent.futures import ThreadPoolExecutor, as_completed
+import json
+import os
 import re
+import tempfile
+import threading
 import time
 
 import paramiko
@@ -332,6 +351,70 @@ SSH_MAPPER_BASE = sorted(
 )
 SSH_MAPPER_BASE.reverse()
 
+# (device_type, pattern, priority) checked against the SSH server version, the SSH banner and
+# the output received right after login, before sending any command. Patterns are searched
+# with re.MULTILINE. Only the SSH server version and the prompt are trusted: a priority 99
+# pattern ends the detection only when it matches one of them (elsewhere it counts as
+# BANNER_HINT_PRIORITY). Text that only shows up in the banner/MOTD (which anyone can write)
+# gets BANNER_HINT_PRIORITY: the device_type is probed first instead of being assumed.
+BANNER_HINT_PRIORITY = 90
+
+SSH_BANNER_MAPPER: List[Tuple[str, str, int]] = [
+    # Prompt
+    ("cisco_xr", r"^RP/\d+/\w+/CPU\d+:\S+#\s*$", 99),
+    ("juniper_junos", r"^[\w.-]+@[\w.-]+[>%]\s*$", 50),
+    ("huawei", r"^<[\w.-]+>\s*$", 50),
+    ("hp_comware", r"^<[\w.-]+>\s*$", 50),
+    ("linux", r"^[\w.-]+@[\w.-]+:[^\n]*[$#]\s*$", 50),
+    # Banner/MOTD
+    ("cisco_nxos", r"Cisco Nexus Operating System", BANNER_HINT_PRIORITY),
+    ("juniper_junos", r"^--- JUNOS \d", BANNER_HINT_PRIORITY),
+    ("extreme_exos", r"ExtremeXOS", BANNER_HINT_PRIORITY),
+    ("huawei", r"Info: The max number of VTY users", BANNER_HINT_PRIORITY),
+]
+
+DEFAULT_AUTODETECT_WORKERS = 20
+
+
+class AutodetectCache(object):
+    """
+    JSON file of autodetect results, keyed by SSH host key fingerprint.
+
+    Keying on the host key instead of the hostname/IP means a replaced or re-installed device
+    (new host key) is detected again. Access is thread-safe, call save() to write the file.
+    """
+
+    def __init__(self, cache_file: str) -> None:
+        self.cache_file = cache_file
+        self._lock = threading.Lock()
+        self._entries: Dict[str, Dict[str, str]] = {}
+        if os.path.isfile(cache_file):
+            with open(cache_file) as f:
+                self._entries = json.load(f)
+
+    def get(self, fingerprint: str) -> Optional[str]:
+        with self._lock:
+            entry = self._entries.get(fingerprint)
+        return entry["device_type"] if entry else None
+
+    def set(self, fingerprint: str, host: str, device_type: str) -> None:
+        with self._lock:
+            self._entries[fingerprint] = {"host": host, "device_type": device_type}
+
+    def save(self) -> None:
+        """Write the cache file atomically."""
+        with self._lock:
+            data = json.dumps(self._entries, indent=2, sort_keys=True)
+        cache_dir = os.path.dirname(os.path.abspath(self.cache_file))
+        fd, tmp_file = tempfile.mkstemp(dir=cache_dir, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "w") as f:
+                f.write(data)
+            os.replace(tmp_file, self.cache_file)
+        except BaseException:
+            os.unlink(tmp_file)
+            raise
+
 
 class SSHDetect(object):
     """
@@ -345,6 +428,9 @@ class SSHDetect(object):
         The same *args that you might provide to the netmiko.ssh_dispatcher.ConnectHandler.
     *kwargs : dict
         The same *kwargs that you might provide to the netmiko.ssh_dispatcher.ConnectHandler.
+    cache : AutodetectCache, optional
+        Results of previous detections. A device whose SSH host key is in the cache is not
+        detected again, new results are added to the cache.
 
     Attributes
     ----------
@@ -353,6 +439,8 @@ class SSHDetect(object):
     potential_matches: dict
         Dict of (device_type, accuracy) that is populated through an interaction with the
         remote end.
+    cached_match: str or None
+        The device type found in the cache.
 
     Methods
     -------
@@ -360,7 +448,9 @@ class SSHDetect(object):
         Try to determine the device type.
     """
 
-    def __init__(self, *args: Any, **kwargs: Any) -> None:
+    def __init__(
+        self, *args: Any, cache: Optional[AutodetectCache] = None, **kwargs: Any
+    ) -> None:
         """
         Constructor of the SSHDetect class
         """
@@ -369,26 +459,73 @@ class SSHDetect(object):
         # Always set cmd_verify to False for autodetect
         kwargs["global_cmd_verify"] = False
         self.connection = ConnectHandler(*args, **kwargs)
+        self.cache = cache
+        self.potential_matches: Dict[str, int] = {}
+        self._results_cache: Dict[str, str] = {}
 
-        # Add additional sleep to let the login complete.
-        time.sleep(3)
-
-        # Call the _test_channel_read() in base to clear initial data
+        self.host_key_fingerprint: Optional[str] = None
+        try:
+            transport = self.connection.remote_conn.transport  # type: ignore
+            self.host_key_fingerprint = transport.get_remote_server_key().fingerprint
+        except Exception:
+            pass
+        self.cached_match: Optional[str] = None
+        if cache is not None and self.host_key_fingerprint:
+            self.cached_match = cache.get(self.host_key_fingerprint)
+
+        self.initial_buffer = ""
+        self._prompt = ""
+        self._prompt_re: Optional[re.Pattern] = None
+        if self.cached_match:
+            # No need to wait for the rest of the login
+            return
+
+        # Call the _test_channel_read() in base to clear initial data. It keeps reading until
+        # the channel has been quiet for a while, so the login (and MOTD) is complete.
         output = BaseConnection._test_channel_read(self.connection)
         self.initial_buffer = output
-        self.potential_matches: Dict[str, int] = {}
-        self._results_cache: Dict[str, str] = {}
+
+        # The last line received after login is the prompt, command output is complete once
+        # it shows up again.
+        lines = self.connection.strip_backspaces(output).strip().splitlines()
+        self._prompt = lines[-1].strip() if lines else ""
+        if self._prompt:
+            self._prompt_re = re.compile(
+                r"^{}\s*$".format(re.escape(self._prompt)), flags=re.M
+            )
 
     def autodetect(self) -> Union[str, None]:
         """
         Try to guess the best 'device_type' based on patterns defined in SSH_MAPPER_BASE
 
+        The SSH banner and the login prompt are checked first (SSH_BANNER_MAPPER), commands are
+        only sent when that is not conclusive.
+
         Returns
         -------
         best_match : str or None
             The device type that is currently the best to use to interact with the device
         """
-        for device_type, autodetect_dict in SSH_MAPPER_BASE:
+        if self.cached_match:
+            self.connection.disconnect()
+            return self.cached_match
+
+        best_match = self._autodetect()
+        if self.cache is not None and best_match and self.host_key_fingerprint:
+            self.cache.set(self.host_key_fingerprint, self.connection.host, best_match)
+        return best_match
+
+    def _autodetect(self) -> Union[str, None]:
+        hints = self._autodetect_banner()
+        best_hint = max(hints.items(), key=lambda t: t[1], default=None)
+        if best_hint and best_hint[1] >= 99:
+            self.potential_matches.update(hints)
+            self.connection.disconnect()
+            return best_hint[0]
+
+        # Probe the device_types hinted by the banner/prompt first
+        probes = sorted(SSH_MAPPER_BASE, key=lambda item: -hints.get(item[0], 0))
+        for device_type, autodetect_dict in probes:
             tmp_dict = autodetect_dict.copy()
             call_method = tmp_dict.pop("dispatch")
             assert isinstance(call_method, str)
@@ -419,10 +556,49 @@ class SSHDetect(object):
         self.connection.disconnect()
         return best_match[0][0]
 
+    def _autodetect_banner(self) -> Dict[str, int]:
+        """
+        Match SSH_BANNER_MAPPER against the SSH server version, the SSH banner and the output
+        received after login. Priority 99 is only kept for matches in the SSH server version or
+        the prompt, matches in the free text of the banner and MOTD get BANNER_HINT_PRIORITY.
+
+        Returns
+        -------
+        hints : dict
+            Dict of (device_type, priority) for the patterns that matched.
+        """
+        remote_version = ""
+        banner = ""
+        try:
+            transport = self.connection.remote_conn.transport  # type: ignore
+            remote_version = transport.remote_version or ""
+            banner = transport.get_banner() or b""
+            if isinstance(banner, bytes):
+                banner = banner.decode("utf-8", "replace")
+        except Exception:
+            pass
+        trusted_text = "\n".join([remote_version, self._prompt])
+        text = "\n".join(
+            [self.connection.strip_backspaces(self.initial_buffer), remote_version, banner]
+        )
+
+        hints: Dict[str, int] = {}
+        for device_type, pattern, priority in SSH_BANNER_MAPPER:
+            if priority >= 99 and not re.search(pattern, trusted_text, flags=re.M):
+                priority = BANNER_HINT_PRIORITY
+            if priority > hints.get(device_type, 0) and re.search(
+                pattern, text, flags=re.M
+            ):
+                hints[device_type] = priority
+        return hints
+
     def _send_command(self, cmd: str = "") -> str:
         """
         Handle reading/writing channel directly. It is also sanitizing the output received.
 
+        Reading stops as soon as the login prompt is received again. If the prompt does not
+        show up, reading stops once the channel has been quiet for 6 seconds.
+
         Parameters
         ----------
         cmd : str, optional
@@ -434,11 +610,27 @@ class SSHDetect(object):
             The output from the command sent
         """
         self.connection.write_channel(cmd + "\n")
-        time.sleep(1)
-        output = self.connection.read_channel_timing(last_read=6.0)
+        output = self._read_until_prompt(last_read=6.0, read_timeout=120.0)
         output = self.connection.strip_backspaces(output)
         return output
 
+    def _read_until_prompt(self, last_read: float, read_timeout: float) -> str:
+        """Read until the prompt is seen, no new data for last_read seconds or read_timeout."""
+        output = ""
+        start_time = last_data = time.time()
+        while time.time() - start_time < read_timeout:
+            new_data = self.connection.read_channel()
+            if new_data:
+                output += new_data
+                last_data = time.time()
+                if self._prompt_re and self._prompt_re.search(output):
+                    break
+                continue
+            if output and time.time() - last_data >= last_read:
+                break
+            self.connection.channel.wait_for_data(0.1)
+        return output
+
     def _send_command_wrapper(self, cmd: str) -> str:
         """
         Send command to the remote device with a caching feature to avoid sending the same command
@@ -555,3 +747,48 @@ class SSHDetect(object):
         except Exception:
             return 0
         return 0
+
+
+def _autodetect_device(
+    device: Dict[str, Any], cache: Optional[AutodetectCache]
+) -> Optional[str]:
+    guesser = SSHDetect(cache=cache, **dict(device, device_type="autodetect"))
+    return guesser.autodetect()
+
+
+def autodetect_many(
+    devices: Iterable[Dict[str, Any]],
+    cache_file: Optional[str] = None,
+    max_workers: int = DEFAULT_AUTODETECT_WORKERS,
+) -> Dict[str, Union[Optional[str], Exception]]:
+    """Auto-detect the device_type of many devices in parallel.
+
+    devices are ConnectHandler arguments (device_type is ignored). At most max_workers
+    devices are connected at the same time.
+
+    With a cache_file, devices whose SSH host key is already in the cache are not detected
+    again (the session is closed right after login). New results are added to the cache_file.
+
+    return {
+        'host': the detected device_type, None or the exception that was raised,
+    }
+    """
+    cache = AutodetectCache(cache_file) if cache_file else None
+    results: Dict[str, Union[Optional[str], Exception]] = {}
+    try:
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            futures = {
+                executor.submit(_autodetect_device, device, cache): device.get("host")
+                or device.get("ip", "")
+                for device in devices
+            }
+            for future in as_completed(futures):
+                host = futures[future]
+                try:
+                    results[host] = future.result()
+                except Exception as e:
+                    results[host] = e
+    finally:
+        if cache is not None:
+            cache.save()
+    return results
@@ -1,304 +1,219 @@
 """Controls selection of proper class based on the device type."""
 
-from typing import Any, Type, Optional
+from typing import Any, Dict, Iterator, Type, Optional, Union
 from typing import TYPE_CHECKING
+from collections.abc import MutableMapping
+import importlib
 import re
 from netmiko.exceptions import ConnectionException
 from netmiko.exceptions import NetmikoTimeoutException, NetmikoAuthenticationException
-from netmiko.a10 import A10SSH
-from netmiko.accedian import AccedianSSH
-from netmiko.adtran import AdtranOSSSH, AdtranOSTelnet
-from netmiko.adva import AdvaAosFsp150F3SSH, AdvaAosFsp150F2SSH
-from netmiko.alcatel import AlcatelAosSSH
-from netmiko.allied_telesis import AlliedTelesisAwplusSSH
-from netmiko.arista import AristaSSH, AristaTelnet
-from netmiko.arista import AristaFileTransfer
-from netmiko.arris import ArrisCERSSH
-from netmiko.apresia import ApresiaAeosSSH, ApresiaAeosTelnet
-from netmiko.aruba import ArubaOsSSH, ArubaCxSSH
-from netmiko.audiocode import (
-    Audiocode72SSH,
-    Audiocode66SSH,
-    AudiocodeShellSSH,
-    Audiocode72Telnet,
-    Audiocode66Telnet,
-    AudiocodeShellTelnet,
-)
-from netmiko.brocade import BrocadeFOSSSH
-from netmiko.broadcom import BroadcomIcosSSH
-from netmiko.calix import CalixB6SSH, CalixB6Telnet
-from netmiko.casa import CasaCMTSSSH
-from netmiko.cdot import CdotCrosSSH
-from netmiko.centec import CentecOSSSH, CentecOSTelnet
-from netmiko.checkpoint import CheckPointGaiaSSH
-from netmiko.ciena import CienaSaosSSH, CienaSaosTelnet, CienaSaosFileTransfer
-from netmiko.cisco import CiscoAsaSSH, CiscoAsaFileTransfer
-from netmiko.cisco import CiscoFtdSSH
-from netmiko.cisco import (
-    CiscoIosSSH,
-    CiscoIosFileTransfer,
-    CiscoIosTelnet,
-    CiscoIosSerial,
-)
-from netmiko.cisco import CiscoNxosSSH, CiscoNxosFileTransfer
-from netmiko.cisco import CiscoS200SSH, CiscoS200Telnet
-from netmiko.cisco import CiscoS300SSH, CiscoS300Telnet
-from netmiko.cisco import CiscoTpTcCeSSH
-from netmiko.cisco import CiscoViptelaSSH
-from netmiko.cisco import CiscoWlcSSH
-from netmiko.cisco import CiscoXrSSH, CiscoXrTelnet, CiscoXrFileTransfer
-from netmiko.citrix import NetscalerSSH
-from netmiko.cloudgenix import CloudGenixIonSSH
-from netmiko.coriant import CoriantSSH
-from netmiko.dell import DellDNOS6SSH
-from netmiko.dell import DellDNOS6Telnet
-from netmiko.dell import DellForce10SSH
-from netmiko.dell import DellOS10SSH, DellOS10FileTransfer
-from netmiko.dell import DellSonicSSH
-from netmiko.dell import DellPowerConnectSSH
-from netmiko.dell import DellPowerConnectTelnet
-from netmiko.dell import DellIsilonSSH
-from netmiko.digi import DigiTransportSSH
-from netmiko.dlink import DlinkDSTelnet, DlinkDSSSH
-from netmiko.eltex import EltexSSH, EltexEsrSSH
-from netmiko.endace import EndaceSSH
-from netmiko.enterasys import EnterasysSSH
-from netmiko.ericsson import (
-    EricssonIposSSH,
-    EricssonMinilink63SSH,
-    EricssonMinilink66SSH,
-)
-from netmiko.extreme import ExtremeErsSSH
-from netmiko.extreme import ExtremeExosSSH, ExtremeExosFileTransfer
-from netmiko.extreme import ExtremeExosTelnet
-from netmiko.extreme import ExtremeNetironSSH
-from netmiko.extreme import ExtremeNetironTelnet
-from netmiko.extreme import ExtremeNosSSH
-from netmiko.extreme import ExtremeSlxSSH
-from netmiko.extreme import ExtremeTierraSSH
-from netmiko.extreme import ExtremeVspSSH
-from netmiko.extreme import ExtremeWingSSH
-from netmiko.f5 import F5TmshSSH
-from netmiko.f5 import F5LinuxSSH
-from netmiko.fiberstore import FiberstoreFsosSSH
-from netmiko.flexvnf import FlexvnfSSH
-from netmiko.fortinet import FortinetSSH
-from netmiko.hillstone import HillstoneStoneosSSH
-from netmiko.hp import HPProcurveSSH, HPProcurveTelnet, HPComwareSSH, HPComwareTelnet
-from netmiko.huawei import HuaweiSSH, HuaweiVrpv8SSH, HuaweiTelnet
-from netmiko.huawei import HuaweiSmartAXSSH
-from netmiko.ipinfusion import IpInfusionOcNOSSSH, IpInfusionOcNOSTelnet
-from netmiko.juniper import JuniperSSH, JuniperTelnet, JuniperScreenOsSSH
-from netmiko.juniper import JuniperFileTransfer
-from netmiko.keymile import KeymileSSH, KeymileNOSSSH
-from netmiko.linux import LinuxSSH, LinuxFileTransfer
-from netmiko.maipu import MaipuSSH
-from netmiko.maipu import MaipuTelnet
-from netmiko.mikrotik import MikrotikRouterOsSSH, MikrotikRouterOsFileTransfer
-from netmiko.mikrotik import MikrotikSwitchOsSSH
-from netmiko.mellanox import MellanoxMlnxosSSH
-from netmiko.mrv import MrvLxSSH
-from netmiko.mrv import MrvOptiswitchSSH
-from netmiko.netapp import NetAppcDotSSH
-from netmiko.nokia import (
-    NokiaSrosSSH,
-    NokiaSrosFileTransfer,
-    NokiaSrosTelnet,
-    NokiaSrlSSH,
-)
-from netmiko.netgear import NetgearProSafeSSH
-from netmiko.oneaccess import OneaccessOneOSTelnet, OneaccessOneOSSSH
-from netmiko.ovs import OvsLinuxSSH
-from netmiko.paloalto import PaloAltoPanosSSH
-from netmiko.paloalto import PaloAltoPanosTelnet
-from netmiko.pluribus import PluribusSSH
-from netmiko.quanta import QuantaMeshSSH
-from netmiko.rad import RadETXSSH
-from netmiko.rad import RadETXTelnet
-from netmiko.raisecom import RaisecomRoapSSH
-from netmiko.raisecom import RaisecomRoapTelnet
-from netmiko.ruckus import RuckusFastironSSH
-from netmiko.ruckus import RuckusFastironTelnet
-from netmiko.ruijie import RuijieOSSSH, RuijieOSTelnet
-from netmiko.sixwind import SixwindOSSSH
-from netmiko.sophos import SophosSfosSSH
-from netmiko.teldat import TeldatCITSSH, TeldatCITTelnet
-from netmiko.terminal_server import TerminalServerSSH
-from netmiko.terminal_server import TerminalServerTelnet
-from netmiko.tplink import TPLinkJetStreamSSH, TPLinkJetStreamTelnet
-from netmiko.ubiquiti import UbiquitiEdgeRouterSSH, UbiquitiEdgeRouterFileTransfer
-from netmiko.ubiquiti import UbiquitiEdgeSSH
-from netmiko.ubiquiti import UbiquitiUnifiSwitchSSH
-from netmiko.vyos import VyOSSSH
-from netmiko.watchguard import WatchguardFirewareSSH
-from netmiko.yamaha import YamahaSSH
-from netmiko.yamaha import YamahaTelnet
-from netmiko.zte import ZteZxrosSSH
-from netmiko.zte import ZteZxrosTelnet
-from netmiko.supermicro import SmciSwitchSmisSSH
-from netmiko.supermicro import SmciSwitchSmisTelnet
-from netmiko.zyxel import ZyxelSSH
 
 
 if TYPE_CHECKING:
     from netmiko.base_connection import BaseConnection
     from netmiko.scp_handler import BaseFileTransfer
 
-GenericSSH = TerminalServerSSH
-GenericTelnet = TerminalServerTelnet
 
-# The keys of this dictionary are the supported device_types
+def _import_class(class_path: str) -> Type[Any]:
+    """Import and return a class given as "package.ClassName"."""
+    module_name, class_name = class_path.rsplit(".", 1)
+    return getattr(importlib.import_module(module_name), class_name)
+
+
+class LazyClassMapper(MutableMapping):  # type: ignore
+    """Mapping of device_type to driver class that imports each driver on first use.
+
+    Values can be "package.ClassName" strings or classes (e.g. to register a custom
+    driver). A string is replaced by the imported class the first time it is looked up.
+    """
+
+    def __init__(self, mapping: Dict[str, Union[str, Type[Any]]]) -> None:
+        self._mapping = dict(mapping)
+
+    def __getitem__(self, device_type: str) -> Type[Any]:
+        driver = self._mapping[device_type]
+        if isinstance(driver, str):
+            driver = _import_class(driver)
+            self._mapping[device_type] = driver
+        return driver
+
+    def __setitem__(self, device_type: str, driver: Union[str, Type[Any]]) -> None:
+        self._mapping[device_type] = driver
+
+    def __delitem__(self, device_type: str) -> None:
+        del self._mapping[device_type]
+
+    def __contains__(self, device_type: object) -> bool:
+        # Don't import the driver just to test membership
+        return device_type in self._mapping
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._mapping)
+
+    def __len__(self) -> int:
+        return len(self._mapping)
+
+    def class_path(self, device_type: str) -> str:
+        """Return the "package.ClassName" of the driver without importing it."""
+        driver = self._mapping[device_type]
+        if isinstance(driver, str):
+            return driver
+        return f"{driver.__module__}.{driver.__name__}"
+
+
+# The keys of this dictionary are the supported device_types, the values are the
+# "package.ClassName" of their driver, which is only imported when it is used.
 CLASS_MAPPER_BASE = {
-    "a10": A10SSH,
-    "accedian": AccedianSSH,
-    "adtran_os": AdtranOSSSH,
-    "adva_fsp150f2": AdvaAosFsp150F2SSH,
-    "adva_fsp150f3": AdvaAosFsp150F3SSH,
-    "alcatel_aos": AlcatelAosSSH,
-    "alcatel_sros": NokiaSrosSSH,
-    "allied_telesis_awplus": AlliedTelesisAwplusSSH,
-    "apresia_aeos": ApresiaAeosSSH,
-    "arista_eos": AristaSSH,
-    "arris_cer": ArrisCERSSH,
-    "aruba_os": ArubaOsSSH,
-    "aruba_aoscx": ArubaCxSSH,
-    "aruba_osswitch": HPProcurveSSH,
-    "aruba_procurve": HPProcurveSSH,
-    "audiocode_72": Audiocode72SSH,
-    "audiocode_66": Audiocode66SSH,
-    "audiocode_shell": AudiocodeShellSSH,
-    "avaya_ers": ExtremeErsSSH,
-    "avaya_vsp": ExtremeVspSSH,
-    "broadcom_icos": BroadcomIcosSSH,
-    "brocade_fos": BrocadeFOSSSH,
-    "brocade_fastiron": RuckusFastironSSH,
-    "brocade_netiron": ExtremeNetironSSH,
-    "brocade_nos": ExtremeNosSSH,
-    "brocade_vdx": ExtremeNosSSH,
-    "brocade_vyos": VyOSSSH,
-    "checkpoint_gaia": CheckPointGaiaSSH,
-    "calix_b6": CalixB6SSH,
-    "casa_cmts": CasaCMTSSSH,
-    "cdot_cros": CdotCrosSSH,
-    "centec_os": CentecOSSSH,
-    "ciena_saos": CienaSaosSSH,
-    "cisco_asa": CiscoAsaSSH,
-    "cisco_ftd": CiscoFtdSSH,
-    "cisco_ios": CiscoIosSSH,
-    "cisco_nxos": CiscoNxosSSH,
-    "cisco_s200": CiscoS200SSH,
-    "cisco_s300": CiscoS300SSH,
-    "cisco_tp": CiscoTpTcCeSSH,
-    "cisco_viptela": CiscoViptelaSSH,
-    "cisco_wlc": CiscoWlcSSH,
-    "cisco_xe": CiscoIosSSH,
-    "cisco_xr": CiscoXrSSH,
-    "cloudgenix_ion": CloudGenixIonSSH,
-    "coriant": CoriantSSH,
-    "dell_dnos9": DellForce10SSH,
-    "dell_force10": DellForce10SSH,
-    "dell_os6": DellDNOS6SSH,
-    "dell_os9": DellForce10SSH,
-    "dell_os10": DellOS10SSH,
-    "dell_sonic": DellSonicSSH,
-    "dell_powerconnect": DellPowerConnectSSH,
-    "dell_isilon": DellIsilonSSH,
-    "dlink_ds": DlinkDSSSH,
-    "digi_transport": DigiTransportSSH,
-    "endace": EndaceSSH,
-    "eltex": EltexSSH,
-    "eltex_esr": EltexEsrSSH,
-    "enterasys": EnterasysSSH,
-    "ericsson_ipos": EricssonIposSSH,
-    "ericsson_mltn63": EricssonMinilink63SSH,
-    "ericsson_mltn66": EricssonMinilink66SSH,
-    "extreme": ExtremeExosSSH,
-    "extreme_ers": ExtremeErsSSH,
-    "extreme_exos": ExtremeExosSSH,
-    "extreme_netiron": ExtremeNetironSSH,
-    "extreme_nos": ExtremeNosSSH,
-    "extreme_slx": ExtremeSlxSSH,
-    "extreme_tierra": ExtremeTierraSSH,
-    "extreme_vdx": ExtremeNosSSH,
-    "extreme_vsp": ExtremeVspSSH,
-    "extreme_wing": ExtremeWingSSH,
-    "f5_ltm": F5TmshSSH,
-    "f5_tmsh": F5TmshSSH,
-    "f5_linux": F5LinuxSSH,
-    "fiberstore_fsos": FiberstoreFsosSSH,
-    "flexvnf": FlexvnfSSH,
-    "fortinet": FortinetSSH,
-    "generic": GenericSSH,
-    "generic_termserver": TerminalServerSSH,
-    "hillstone_stoneos": HillstoneStoneosSSH,
-    "hp_comware": HPComwareSSH,
-    "hp_procurve": HPProcurveSSH,
-    "huawei": HuaweiSSH,
-    "huawei_smartax": HuaweiSmartAXSSH,
-    "huawei_olt": HuaweiSmartAXSSH,
-    "huawei_vrp": HuaweiSSH,
-    "huawei_vrpv8": HuaweiVrpv8SSH,
-    "ipinfusion_ocnos": IpInfusionOcNOSSSH,
-    "juniper": JuniperSSH,
-    "juniper_junos": JuniperSSH,
-    "juniper_screenos": JuniperScreenOsSSH,
-    "keymile": KeymileSSH,
-    "keymile_nos": KeymileNOSSSH,
-    "linux": LinuxSSH,
-    "mikrotik_routeros": MikrotikRouterOsSSH,
-    "mikrotik_switchos": MikrotikSwitchOsSSH,
-    "mellanox": MellanoxMlnxosSSH,
-    "mellanox_mlnxos": MellanoxMlnxosSSH,
-    "mrv_lx": MrvLxSSH,
-    "mrv_optiswitch": MrvOptiswitchSSH,
-    "netapp_cdot": NetAppcDotSSH,
-    "netgear_prosafe": NetgearProSafeSSH,
-    "netscaler": NetscalerSSH,
-    "nokia_sros": NokiaSrosSSH,
-    "nokia_srl": NokiaSrlSSH,
-    "oneaccess_oneos": OneaccessOneOSSSH,
-    "ovs_linux": OvsLinuxSSH,
-    "paloalto_panos": PaloAltoPanosSSH,
-    "pluribus": PluribusSSH,
-    "quanta_mesh": QuantaMeshSSH,
-    "rad_etx": RadETXSSH,
-    "raisecom_roap": RaisecomRoapSSH,
-    "ruckus_fastiron": RuckusFastironSSH,
-    "ruijie_os": RuijieOSSSH,
-    "sixwind_os": SixwindOSSSH,
-    "sophos_sfos": SophosSfosSSH,
-    "supermicro_smis": SmciSwitchSmisSSH,
-    "teldat_cit": TeldatCITSSH,
-    "tplink_jetstream": TPLinkJetStreamSSH,
+    "a10": "netmiko.a10.A10SSH",
+    "accedian": "netmiko.accedian.AccedianSSH",
+    "adtran_os": "netmiko.adtran.AdtranOSSSH",
+    "adva_fsp150f2": "netmiko.adva.AdvaAosFsp150F2SSH",
+    "adva_fsp150f3": "netmiko.adva.AdvaAosFsp150F3SSH",
+    "alcatel_aos": "netmiko.alcatel.AlcatelAosSSH",
+    "alcatel_sros": "netmiko.nokia.NokiaSrosSSH",
+    "allied_telesis_awplus": "netmiko.allied_telesis.AlliedTelesisAwplusSSH",
+    "apresia_aeos": "netmiko.apresia.ApresiaAeosSSH",
+    "arista_eos": "netmiko.arista.AristaSSH",
+    "arris_cer": "netmiko.arris.ArrisCERSSH",
+    "aruba_os": "netmiko.aruba.ArubaOsSSH",
+    "aruba_aoscx": "netmiko.aruba.ArubaCxSSH",
+    "aruba_osswitch": "netmiko.hp.HPProcurveSSH",
+    "aruba_procurve": "netmiko.hp.HPProcurveSSH",
+    "audiocode_72": "netmiko.audiocode.Audiocode72SSH",
+    "audiocode_66": "netmiko.audiocode.Audiocode66SSH",
+    "audiocode_shell": "netmiko.audiocode.AudiocodeShellSSH",
+    "avaya_ers": "netmiko.extreme.ExtremeErsSSH",
+    "avaya_vsp": "netmiko.extreme.ExtremeVspSSH",
+    "broadcom_icos": "netmiko.broadcom.BroadcomIcosSSH",
+    "brocade_fos": "netmiko.brocade.BrocadeFOSSSH",
+    "brocade_fastiron": "netmiko.ruckus.RuckusFastironSSH",
+    "brocade_netiron": "netmiko.extreme.ExtremeNetironSSH",
+    "brocade_nos": "netmiko.extreme.ExtremeNosSSH",
+    "brocade_vdx": "netmiko.extreme.ExtremeNosSSH",
+    "brocade_vyos": "netmiko.vyos.VyOSSSH",
+    "checkpoint_gaia": "netmiko.checkpoint.CheckPointGaiaSSH",
+    "calix_b6": "netmiko.calix.CalixB6SSH",
+    "casa_cmts": "netmiko.casa.CasaCMTSSSH",
+    "cdot_cros": "netmiko.cdot.CdotCrosSSH",
+    "centec_os": "netmiko.centec.CentecOSSSH",
+    "ciena_saos": "netmiko.ciena.CienaSaosSSH",
+    "cisco_asa": "netmiko.cisco.CiscoAsaSSH",
+    "cisco_ftd": "netmiko.cisco.CiscoFtdSSH",
+    "cisco_ios": "netmiko.cisco.CiscoIosSSH",
+    "cisco_nxos": "netmiko.cisco.CiscoNxosSSH",
+    "cisco_s200": "netmiko.cisco.CiscoS200SSH",
+    "cisco_s300": "netmiko.cisco.CiscoS300SSH",
+    "cisco_tp": "netmiko.cisco.CiscoTpTcCeSSH",
+    "cisco_viptela": "netmiko.cisco.CiscoViptelaSSH",
+    "cisco_wlc": "netmiko.cisco.CiscoWlcSSH",
+    "cisco_xe": "netmiko.cisco.CiscoIosSSH",
+    "cisco_xr": "netmiko.cisco.CiscoXrSSH",
+    "cloudgenix_ion": "netmiko.cloudgenix.CloudGenixIonSSH",
+    "coriant": "netmiko.coriant.CoriantSSH",
+    "dell_dnos9": "netmiko.dell.DellForce10SSH",
+    "dell_force10": "netmiko.dell.DellForce10SSH",
+    "dell_os6": "netmiko.dell.DellDNOS6SSH",
+    "dell_os9": "netmiko.dell.DellForce10SSH",
+    "dell_os10": "netmiko.dell.DellOS10SSH",
+    "dell_sonic": "netmiko.dell.DellSonicSSH",
+    "dell_powerconnect": "netmiko.dell.DellPowerConnectSSH",
+    "dell_isilon": "netmiko.dell.DellIsilonSSH",
+    "dlink_ds": "netmiko.dlink.DlinkDSSSH",
+    "digi_transport": "netmiko.digi.DigiTransportSSH",
+    "endace": "netmiko.endace.EndaceSSH",
+    "eltex": "netmiko.eltex.EltexSSH",
+    "eltex_esr": "netmiko.eltex.EltexEsrSSH",
+    "enterasys": "netmiko.enterasys.EnterasysSSH",
+    "ericsson_ipos": "netmiko.ericsson.EricssonIposSSH",
+    "ericsson_mltn63": "netmiko.ericsson.EricssonMinilink63SSH",
+    "ericsson_mltn66": "netmiko.ericsson.EricssonMinilink66SSH",
+    "extreme": "netmiko.extreme.ExtremeExosSSH",
+    "extreme_ers": "netmiko.extreme.ExtremeErsSSH",
+    "extreme_exos": "netmiko.extreme.ExtremeExosSSH",
+    "extreme_netiron": "netmiko.extreme.ExtremeNetironSSH",
+    "extreme_nos": "netmiko.extreme.ExtremeNosSSH",
+    "extreme_slx": "netmiko.extreme.ExtremeSlxSSH",
+    "extreme_tierra": "netmiko.extreme.ExtremeTierraSSH",
+    "extreme_vdx": "netmiko.extreme.ExtremeNosSSH",
+    "extreme_vsp": "netmiko.extreme.ExtremeVspSSH",
+    "extreme_wing": "netmiko.extreme.ExtremeWingSSH",
+    "f5_ltm": "netmiko.f5.F5TmshSSH",
+    "f5_tmsh": "netmiko.f5.F5TmshSSH",
+    "f5_linux": "netmiko.f5.F5LinuxSSH",
+    "fiberstore_fsos": "netmiko.fiberstore.FiberstoreFsosSSH",
+    "flexvnf": "netmiko.flexvnf.FlexvnfSSH",
+    "fortinet": "netmiko.fortinet.FortinetSSH",
+    "generic": "netmiko.terminal_server.TerminalServerSSH",
+    "generic_termserver": "netmiko.terminal_server.TerminalServerSSH",
+    "hillstone_stoneos": "netmiko.hillstone.HillstoneStoneosSSH",
+    "hp_comware": "netmiko.hp.HPComwareSSH",
+    "hp_procurve": "netmiko.hp.HPProcurveSSH",
+    "huawei": "netmiko.huawei.HuaweiSSH",
+    "huawei_smartax": "netmiko.huawei.HuaweiSmartAXSSH",
+    "huawei_olt": "netmiko.huawei.HuaweiSmartAXSSH",
+    "huawei_vrp": "netmiko.huawei.HuaweiSSH",
+    "huawei_vrpv8": "netmiko.huawei.HuaweiVrpv8SSH",
+    "ipinfusion_ocnos": "netmiko.ipinfusion.IpInfusionOcNOSSSH",
+    "juniper": "netmiko.juniper.JuniperSSH",
+    "juniper_junos": "netmiko.juniper.JuniperSSH",
+    "juniper_screenos": "netmiko.juniper.JuniperScreenOsSSH",
+    "keymile": "netmiko.keymile.KeymileSSH",
+    "keymile_nos": "netmiko.keymile.KeymileNOSSSH",
+    "linux": "netmiko.linux.LinuxSSH",
+    "mikrotik_routeros": "netmiko.mikrotik.MikrotikRouterOsSSH",
+    "mikrotik_switchos": "netmiko.mikrotik.MikrotikSwitchOsSSH",
+    "mellanox": "netmiko.mellanox.MellanoxMlnxosSSH",
+    "mellanox_mlnxos": "netmiko.mellanox.MellanoxMlnxosSSH",
+    "mrv_lx": "netmiko.mrv.MrvLxSSH",
+    "mrv_optiswitch": "netmiko.mrv.MrvOptiswitchSSH",
+    "netapp_cdot": "netmiko.netapp.NetAppcDotSSH",
+    "netgear_prosafe": "netmiko.netgear.NetgearProSafeSSH",
+    "netscaler": "netmiko.citrix.NetscalerSSH",
+    "nokia_sros": "netmiko.nokia.NokiaSrosSSH",
+    "nokia_srl": "netmiko.nokia.NokiaSrlSSH",
+    "oneaccess_oneos": "netmiko.oneaccess.OneaccessOneOSSSH",
+    "ovs_linux": "netmiko.ovs.OvsLinuxSSH",
+    "paloalto_panos": "netmiko.paloalto.PaloAltoPanosSSH",
+    "pluribus": "netmiko.pluribus.PluribusSSH",
+    "quanta_mesh": "netmiko.quanta.QuantaMeshSSH",
+    "rad_etx": "netmiko.rad.RadETXSSH",
+    "raisecom_roap": "netmiko.raisecom.RaisecomRoapSSH",
+    "ruckus_fastiron": "netmiko.ruckus.RuckusFastironSSH",
+    "ruijie_os": "netmiko.ruijie.RuijieOSSSH",
+    "sixwind_os": "netmiko.sixwind.SixwindOSSSH",
+    "sophos_sfos": "netmiko.sophos.SophosSfosSSH",
+    "supermicro_smis": "netmiko.supermicro.SmciSwitchSmisSSH",
+    "teldat_cit": "netmiko.teldat.TeldatCITSSH",
+    "tplink_jetstream": "netmiko.tplink.TPLinkJetStreamSSH",
     # ubiquiti_airos - Placeholder agreed to with NTC (if this driver is created in future)
-    "ubiquiti_edge": UbiquitiEdgeSSH,
-    "ubiquiti_edgerouter": UbiquitiEdgeRouterSSH,
-    "ubiquiti_edgeswitch": UbiquitiEdgeSSH,
-    "ubiquiti_unifiswitch": UbiquitiUnifiSwitchSSH,
-    "vyatta_vyos": VyOSSSH,
-    "vyos": VyOSSSH,
-    "watchguard_fireware": WatchguardFirewareSSH,
-    "zte_zxros": ZteZxrosSSH,
-    "yamaha": YamahaSSH,
-    "zyxel_os": ZyxelSSH,
-    "maipu": MaipuSSH,
+    "ubiquiti_edge": "netmiko.ubiquiti.UbiquitiEdgeSSH",
+    "ubiquiti_edgerouter": "netmiko.ubiquiti.UbiquitiEdgeRouterSSH",
+    "ubiquiti_edgeswitch": "netmiko.ubiquiti.UbiquitiEdgeSSH",
+    "ubiquiti_unifiswitch": "netmiko.ubiquiti.UbiquitiUnifiSwitchSSH",
+    "vyatta_vyos": "netmiko.vyos.VyOSSSH",
+    "vyos": "netmiko.vyos.VyOSSSH",
+    "watchguard_fireware": "netmiko.watchguard.WatchguardFirewareSSH",
+    "zte_zxros": "netmiko.zte.ZteZxrosSSH",
+    "yamaha": "netmiko.yamaha.YamahaSSH",
+    "zyxel_os": "netmiko.zyxel.ZyxelSSH",
+    "maipu": "netmiko.maipu.MaipuSSH",
 }
 
 FILE_TRANSFER_MAP = {
-    "arista_eos": AristaFileTransfer,
-    "ciena_saos": CienaSaosFileTransfer,
-    "cisco_asa": CiscoAsaFileTransfer,
-    "cisco_ios": CiscoIosFileTransfer,
-    "cisco_nxos": CiscoNxosFileTransfer,
-    "cisco_xe": CiscoIosFileTransfer,
-    "cisco_xr": CiscoXrFileTransfer,
-    "dell_os10": DellOS10FileTransfer,
-    "extreme_exos": ExtremeExosFileTransfer,
-    "juniper_junos": JuniperFileTransfer,
-    "linux": LinuxFileTransfer,
-    "nokia_sros": NokiaSrosFileTransfer,
-    "mikrotik_routeros": MikrotikRouterOsFileTransfer,
-    "ubiquiti_edgerouter": UbiquitiEdgeRouterFileTransfer,
+    "arista_eos": "netmiko.arista.AristaFileTransfer",
+    "ciena_saos": "netmiko.ciena.CienaSaosFileTransfer",
+    "cisco_asa": "netmiko.cisco.CiscoAsaFileTransfer",
+    "cisco_ios": "netmiko.cisco.CiscoIosFileTransfer",
+    "cisco_nxos": "netmiko.cisco.CiscoNxosFileTransfer",
+    "cisco_xe": "netmiko.cisco.CiscoIosFileTransfer",
+    "cisco_xr": "netmiko.cisco.CiscoXrFileTransfer",
+    "dell_os10": "netmiko.dell.DellOS10FileTransfer",
+    "extreme_exos": "netmiko.extreme.ExtremeExosFileTransfer",
+    "juniper_junos": "netmiko.juniper.JuniperFileTransfer",
+    "linux": "netmiko.linux.LinuxFileTransfer",
+    "nokia_sros": "netmiko.nokia.NokiaSrosFileTransfer",
+    "mikrotik_routeros": "netmiko.mikrotik.MikrotikRouterOsFileTransfer",
+    "ubiquiti_edgerouter": "netmiko.ubiquiti.UbiquitiEdgeRouterFileTransfer",
 }
 
 # Also support keys that end in _ssh
@@ -307,66 +222,68 @@ for k, v in CLASS_MAPPER_BASE.items():
     new_mapper[k] = v
     alt_key = k + "_ssh"
     new_mapper[alt_key] = v
-CLASS_MAPPER = new_mapper
+CLASS_MAPPER = LazyClassMapper(new_mapper)
 
 new_mapper = {}
 for k, v in FILE_TRANSFER_MAP.items():
     new_mapper[k] = v
     alt_key = k + "_ssh"
     new_mapper[alt_key] = v
-FILE_TRANSFER_MAP = new_mapper
+FILE_TRANSFER_MAP = LazyClassMapper(new_mapper)
 
 # Add telnet drivers
-CLASS_MAPPER["adtran_os_telnet"] = AdtranOSTelnet
-CLASS_MAPPER["apresia_aeos_telnet"] = ApresiaAeosTelnet
-CLASS_MAPPER["arista_eos_telnet"] = AristaTelnet
-CLASS_MAPPER["aruba_procurve_telnet"] = HPProcurveTelnet
-CLASS_MAPPER["audiocode_72_telnet"] = Audiocode72Telnet
-CLASS_MAPPER["audiocode_66_telnet"] = Audiocode66Telnet
-CLASS_MAPPER["audiocode_shell_telnet"] = AudiocodeShellTelnet
-CLASS_MAPPER["brocade_fastiron_telnet"] = RuckusFastironTelnet
-CLASS_MAPPER["brocade_netiron_telnet"] = ExtremeNetironTelnet
-CLASS_MAPPER["calix_b6_telnet"] = CalixB6Telnet
-CLASS_MAPPER["centec_os_telnet"] = CentecOSTelnet
-CLASS_MAPPER["ciena_saos_telnet"] = CienaSaosTelnet
-CLASS_MAPPER["cisco_ios_telnet"] = CiscoIosTelnet
-CLASS_MAPPER["cisco_xr_telnet"] = CiscoXrTelnet
-CLASS_MAPPER["cisco_s200_telnet"] = CiscoS200Telnet
-CLASS_MAPPER["cisco_s300_telnet"] = CiscoS300Telnet
-CLASS_MAPPER["dell_dnos6_telnet"] = DellDNOS6Telnet
-CLASS_MAPPER["dell_powerconnect_telnet"] = DellPowerConnectTelnet
-CLASS_MAPPER["dlink_ds_telnet"] = DlinkDSTelnet
-CLASS_MAPPER["extreme_telnet"] = ExtremeExosTelnet
-CLASS_MAPPER["extreme_exos_telnet"] = ExtremeExosTelnet
-CLASS_MAPPER["extreme_netiron_telnet"] = ExtremeNetironTelnet
-CLASS_MAPPER["generic_telnet"] = GenericTelnet
-CLASS_MAPPER["generic_termserver_telnet"] = TerminalServerTelnet
-CLASS_MAPPER["hp_procurve_telnet"] = HPProcurveTelnet
-CLASS_MAPPER["hp_comware_telnet"] = HPComwareTelnet
-CLASS_MAPPER["huawei_telnet"] = HuaweiTelnet
-CLASS_MAPPER["huawei_olt_telnet"] = HuaweiSmartAXSSH
-CLASS_MAPPER["ipinfusion_ocnos_telnet"] = IpInfusionOcNOSTelnet
-CLASS_MAPPER["juniper_junos_telnet"] = JuniperTelnet
-CLASS_MAPPER["nokia_sros_telnet"] = NokiaSrosTelnet
-CLASS_MAPPER["oneaccess_oneos_telnet"] = OneaccessOneOSTelnet
-CLASS_MAPPER["paloalto_panos_telnet"] = PaloAltoPanosTelnet
-CLASS_MAPPER["rad_etx_telnet"] = RadETXTelnet
-CLASS_MAPPER["raisecom_telnet"] = RaisecomRoapTelnet
-CLASS_MAPPER["ruckus_fastiron_telnet"] = RuckusFastironTelnet
-CLASS_MAPPER["ruijie_os_telnet"] = RuijieOSTelnet
-CLASS_MAPPER["supermicro_smis_telnet"] = SmciSwitchSmisTelnet
-CLASS_MAPPER["teldat_cit_telnet"] = TeldatCITTelnet
-CLASS_MAPPER["tplink_jetstream_telnet"] = TPLinkJetStreamTelnet
-CLASS_MAPPER["yamaha_telnet"] = YamahaTelnet
-CLASS_MAPPER["zte_zxros_telnet"] = ZteZxrosTelnet
-CLASS_MAPPER["maipu_telnet"] = MaipuTelnet
+CLASS_MAPPER["adtran_os_telnet"] = "netmiko.adtran.AdtranOSTelnet"
+CLASS_MAPPER["apresia_aeos_telnet"] = "netmiko.apresia.ApresiaAeosTelnet"
+CLASS_MAPPER["arista_eos_telnet"] = "netmiko.arista.AristaTelnet"
+CLASS_MAPPER["aruba_procurve_telnet"] = "netmiko.hp.HPProcurveTelnet"
+CLASS_MAPPER["audiocode_72_telnet"] = "netmiko.audiocode.Audiocode72Telnet"
+CLASS_MAPPER["audiocode_66_telnet"] = "netmiko.audiocode.Audiocode66Telnet"
+CLASS_MAPPER["audiocode_shell_telnet"] = "netmiko.audiocode.AudiocodeShellTelnet"
+CLASS_MAPPER["brocade_fastiron_telnet"] = "netmiko.ruckus.RuckusFastironTelnet"
+CLASS_MAPPER["brocade_netiron_telnet"] = "netmiko.extreme.ExtremeNetironTelnet"
+CLASS_MAPPER["calix_b6_telnet"] = "netmiko.calix.CalixB6Telnet"
+CLASS_MAPPER["centec_os_telnet"] = "netmiko.centec.CentecOSTelnet"
+CLASS_MAPPER["ciena_saos_telnet"] = "netmiko.ciena.CienaSaosTelnet"
+CLASS_MAPPER["cisco_ios_telnet"] = "netmiko.cisco.CiscoIosTelnet"
+CLASS_MAPPER["cisco_xr_telnet"] = "netmiko.cisco.CiscoXrTelnet"
+CLASS_MAPPER["cisco_s200_telnet"] = "netmiko.cisco.CiscoS200Telnet"
+CLASS_MAPPER["cisco_s300_telnet"] = "netmiko.cisco.CiscoS300Telnet"
+CLASS_MAPPER["dell_dnos6_telnet"] = "netmiko.dell.DellDNOS6Telnet"
+CLASS_MAPPER["dell_powerconnect_telnet"] = "netmiko.dell.DellPowerConnectTelnet"
+CLASS_MAPPER["dlink_ds_telnet"] = "netmiko.dlink.DlinkDSTelnet"
+CLASS_MAPPER["extreme_telnet"] = "netmiko.extreme.ExtremeExosTelnet"
+CLASS_MAPPER["extreme_exos_telnet"] = "netmiko.extreme.ExtremeExosTelnet"
+CLASS_MAPPER["extreme_netiron_telnet"] = "netmiko.extreme.ExtremeNetironTelnet"
+CLASS_MAPPER["generic_telnet"] = "netmiko.terminal_server.TerminalServerTelnet"
+CLASS_MAPPER["generic_termserver_telnet"] = (
+    "netmiko.terminal_server.TerminalServerTelnet"
+)
+CLASS_MAPPER["hp_procurve_telnet"] = "netmiko.hp.HPProcurveTelnet"
+CLASS_MAPPER["hp_comware_telnet"] = "netmiko.hp.HPComwareTelnet"
+CLASS_MAPPER["huawei_telnet"] = "netmiko.huawei.HuaweiTelnet"
+CLASS_MAPPER["huawei_olt_telnet"] = "netmiko.huawei.HuaweiSmartAXSSH"
+CLASS_MAPPER["ipinfusion_ocnos_telnet"] = "netmiko.ipinfusion.IpInfusionOcNOSTelnet"
+CLASS_MAPPER["juniper_junos_telnet"] = "netmiko.juniper.JuniperTelnet"
+CLASS_MAPPER["nokia_sros_telnet"] = "netmiko.nokia.NokiaSrosTelnet"
+CLASS_MAPPER["oneaccess_oneos_telnet"] = "netmiko.oneaccess.OneaccessOneOSTelnet"
+CLASS_MAPPER["paloalto_panos_telnet"] = "netmiko.paloalto.PaloAltoPanosTelnet"
+CLASS_MAPPER["rad_etx_telnet"] = "netmiko.rad.RadETXTelnet"
+CLASS_MAPPER["raisecom_telnet"] = "netmiko.raisecom.RaisecomRoapTelnet"
+CLASS_MAPPER["ruckus_fastiron_telnet"] = "netmiko.ruckus.RuckusFastironTelnet"
+CLASS_MAPPER["ruijie_os_telnet"] = "netmiko.ruijie.RuijieOSTelnet"
+CLASS_MAPPER["supermicro_smis_telnet"] = "netmiko.supermicro.SmciSwitchSmisTelnet"
+CLASS_MAPPER["teldat_cit_telnet"] = "netmiko.teldat.TeldatCITTelnet"
+CLASS_MAPPER["tplink_jetstream_telnet"] = "netmiko.tplink.TPLinkJetStreamTelnet"
+CLASS_MAPPER["yamaha_telnet"] = "netmiko.yamaha.YamahaTelnet"
+CLASS_MAPPER["zte_zxros_telnet"] = "netmiko.zte.ZteZxrosTelnet"
+CLASS_MAPPER["maipu_telnet"] = "netmiko.maipu.MaipuTelnet"
 
 # Add serial drivers
-CLASS_MAPPER["cisco_ios_serial"] = CiscoIosSerial
+CLASS_MAPPER["cisco_ios_serial"] = "netmiko.cisco.CiscoIosSerial"
 
 # Add general terminal_server driver and autodetect
-CLASS_MAPPER["terminal_server"] = TerminalServerSSH
-CLASS_MAPPER["autodetect"] = TerminalServerSSH
+CLASS_MAPPER["terminal_server"] = "netmiko.terminal_server.TerminalServerSSH"
+CLASS_MAPPER["autodetect"] = "netmiko.terminal_server.TerminalServerSSH"
 
 platforms = list(CLASS_MAPPER.keys())
 platforms.sort()
@@ -499,6 +416,18 @@ def ConnUnify(
         raise ConnectionException(msg)
 
 
+def __getattr__(name: str) -> Any:
+    """Import driver classes (and GenericSSH/GenericTelnet) on attribute access."""
+    if name in ("GenericSSH", "GenericTelnet"):
+        name = name.replace("Generic", "TerminalServer")
+    for mapper in (CLASS_MAPPER, FILE_TRANSFER_MAP):
+        for device_type in mapper:
+            class_path = mapper.class_path(device_type)
+            if class_path.rsplit(".", 1)[1] == name:
+                return _import_class(class_path)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
 def ssh_dispatcher(device_type: str) -> Type["BaseConnection"]:
     """Select the class to be instantiated based on vendor/platform."""
     return CLASS_MAPPER[device_type]
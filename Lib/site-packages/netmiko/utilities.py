@@ -11,6 +11,8 @@ from typing import (
     List,
     Dict,
     Tuple,
+    Match,
+    Pattern,
 )
 from typing import TYPE_CHECKING
 import re
@@ -20,10 +22,12 @@ import io
 import os
 from pathlib import Path
 import functools
+import threading
 from datetime import datetime
 import importlib.resources as pkg_resources
 from textfsm import clitable
 from textfsm.clitable import CliTableError
+from textfsm.parser import TextFSM, TextFSMError
 from netmiko import log
 
 # For decorators
@@ -269,9 +273,17 @@ def get_template_dir(_skip_ntc_package: bool = False) -> str:
 
     If `index` file is not found in any of these locations, raise ValueError
 
+    The result is cached per `NET_TEXTFSM` value.
+
     :return: directory containing the TextFSM index file
 
     """
+    return _get_template_dir(os.environ.get("NET_TEXTFSM"), _skip_ntc_package)
+
+
+@functools.lru_cache(maxsize=None)
+def _get_template_dir(template_dir: Optional[str], _skip_ntc_package: bool) -> str:
+    """Resolve the TextFSM template directory (see get_template_dir)."""
 
     msg = """
 Directory containing TextFSM index file not found.
@@ -284,7 +296,6 @@ Alternatively, `pip install ntc-templates` (if using ntc-templates).
 """
 
     # Try NET_TEXTFSM environment variable
-    template_dir = os.environ.get("NET_TEXTFSM")
     if template_dir is not None:
         template_dir = os.path.expanduser(template_dir)
         index = os.path.join(template_dir, "index")
@@ -328,6 +339,25 @@ def clitable_to_dict(cli_table: clitable.CliTable) -> List[Dict[str, str]]:
     return return_list
 
 
+# CliTable objects are reused per thread (CliTable.__init__ takes a class-wide lock)
+_clitable_pool = threading.local()
+
+
+def _get_clitable(
+    index_file: Optional[str], template_dir: Union[str, Path]
+) -> clitable.CliTable:
+    """Return the CliTable for index_file/template_dir owned by the calling thread."""
+    tables = getattr(_clitable_pool, "tables", None)
+    if tables is None:
+        tables = _clitable_pool.tables = {}
+    key = (index_file, str(template_dir))
+    textfsm_obj = tables.get(key)
+    if textfsm_obj is None:
+        textfsm_obj = clitable.CliTable(index_file, template_dir)
+        tables[key] = textfsm_obj
+    return textfsm_obj
+
+
 def _textfsm_parse(
     textfsm_obj: clitable.CliTable,
     raw_output: str,
@@ -376,7 +406,7 @@ def get_structured_data_textfsm(
             )
         template_dir = get_template_dir()
         index_file = os.path.join(template_dir, "index")
-        textfsm_obj = clitable.CliTable(index_file, template_dir)
+        textfsm_obj = _get_clitable(index_file, template_dir)
         output = _textfsm_parse(textfsm_obj, raw_output, attrs)
 
         # Retry the output if "cisco_xe" and not structured data
@@ -390,7 +420,7 @@ def get_structured_data_textfsm(
         template_file = template_path.name
         template_dir_alt = template_path.parents[0]
         # CliTable with no index will fall-back to a TextFSM parsing behavior
-        textfsm_obj = clitable.CliTable(template_dir=template_dir_alt)
+        textfsm_obj = _get_clitable(None, template_dir_alt)
         return _textfsm_parse(
             textfsm_obj, raw_output, attrs, template_file=template_file
         )
@@ -400,6 +430,116 @@ def get_structured_data_textfsm(
 get_structured_data = get_structured_data_textfsm
 
 
+def get_textfsm_parser(
+    platform: Optional[str] = None,
+    command: Optional[str] = None,
+    template: Optional[str] = None,
+) -> Optional[TextFSM]:
+    """
+    Return a new TextFSM object for the template get_structured_data_textfsm() would use.
+
+    Returns None if there is no such template, or if the command is parsed by several templates
+    (their tables are merged, which needs the complete output).
+    """
+    try:
+        if template is None:
+            if platform is None or command is None:
+                return None
+            template_dir = get_template_dir()
+            index_file = os.path.join(template_dir, "index")
+            textfsm_obj = _get_clitable(index_file, template_dir)
+            row_idx = textfsm_obj.index.GetRowMatch(
+                {"Command": command, "Platform": platform}
+            )
+            if not row_idx:
+                return None
+            template_names = textfsm_obj.index.index[row_idx]["Template"]
+        else:
+            template_path = Path(os.path.expanduser(template))
+            textfsm_obj = _get_clitable(None, template_path.parents[0])
+            template_names = template_path.name
+        if ":" in template_names:
+            return None
+        return textfsm_obj._TemplateNamesToFsms(template_names)[0]
+    except (ValueError, OSError, CliTableError, TextFSMError):
+        return None
+
+
+class TextFSMFeeder:
+    """Parse command output with TextFSM while it is still being read from the channel.
+
+    feed() passes the complete lines after the command echo to TextFSM.Feed(). The last line
+    (normally the prompt) is held back until close() gets the sanitized output; if that does
+    not continue what was fed, close() returns None and the output must be parsed as a whole.
+    """
+
+    def __init__(
+        self, fsm: TextFSM, command: str = "", response_return: str = "\n"
+    ) -> None:
+        self.fsm: Optional[TextFSM] = fsm
+        self.command = command
+        self.response_return = response_return
+        self.records: List[List[Any]] = []
+        self._body_start = -1
+        self._fed_end = -1
+
+    def feed(self, output: str) -> None:
+        """Parse the lines completed in output (the output of the previous call plus new data)."""
+        if self.fsm is None:
+            return
+        if self._body_start < 0:
+            # Wait for the first line to decide whether it is the command echo
+            first_return = output.find(self.response_return)
+            if first_return < 0:
+                return
+            if self.command and output.startswith(self.command):
+                self._body_start = first_return + len(self.response_return)
+            else:
+                self._body_start = 0
+            self._fed_end = self._body_start
+        last_return = output.rfind(self.response_return, self._fed_end)
+        if last_return < 0:
+            return
+        end = last_return + len(self.response_return)
+        try:
+            self.records.extend(self.fsm.Feed(output[self._fed_end : end]))
+        except TextFSMError:
+            # Parsing the whole output raises the same error to the caller
+            self.fsm = None
+            return
+        self._fed_end = end
+
+    def close(
+        self, output: str, sanitized_output: str
+    ) -> Optional[List[Dict[str, Any]]]:
+        """Parse the rest of sanitized_output, return the records or None.
+
+        :param output: The output passed to feed()
+
+        :param sanitized_output: output with the command echo and prompt stripped
+        """
+        # Lines received with the prompt are not fed yet
+        self.feed(output)
+        if self.fsm is None or self._body_start < 0:
+            return None
+        fed = output[self._body_start : self._fed_end]
+        if sanitized_output.startswith(fed):
+            rest = sanitized_output[len(fed) :]
+        elif fed == sanitized_output + self.response_return:
+            rest = ""
+        else:
+            return None
+        try:
+            self.records.extend(self.fsm.Feed(rest))
+            self.records.extend(self.fsm.Close())
+        except TextFSMError:
+            return None
+        if not self.records:
+            return None
+        header = [column.lower() for column in self.fsm.header]
+        return [dict(zip(header, record)) for record in self.records]
+
+
 def get_structured_data_ttp(raw_output: str, template: str) -> Union[str, List[Any]]:
     """
     Convert raw CLI output to structured data using TTP template.
@@ -623,6 +763,36 @@ def f_exec_time(func: F) -> F:
     return cast(F, wrapper_decorator)
 
 
+# Regex tokens that can match a line feed: \n, \s, \W, \D, \x0a, negated character
+# classes and an inline DOTALL flag
+LINE_SPANNING_RE = re.compile(r"\\[nsWD]|\\x0[aA]|\[\^|\(\?[aiLmux]*s")
+
+
+class PatternSearch:
+    """Search a regex in output that grows with each read of the channel.
+
+    When the pattern can't match across a line feed, only the tail of the output starting at
+    the last (partial) line is searched again after each read. Patterns that can span lines
+    are searched in the whole output.
+    """
+
+    def __init__(self, pattern: str, re_flags: int = 0) -> None:
+        self.pattern_re: Pattern[str] = re.compile(pattern, flags=re_flags)
+        self.spans_lines = bool(
+            self.pattern_re.flags & re.DOTALL
+            or "\n" in pattern
+            or LINE_SPANNING_RE.search(pattern)
+        )
+        self._search_start = 0
+
+    def search(self, output: str) -> Optional[Match[str]]:
+        """Search the pattern in output (the output passed to the previous call plus new data)."""
+        match = self.pattern_re.search(output, self._search_start)
+        if match is None and not self.spans_lines:
+            self._search_start = output.rfind("\n") + 1
+        return match
+
+
 def calc_old_timeout(
     max_loops: Optional[int] = None,
     delay_factor: Optional[float] = None,
@@ -1,6 +1,7 @@
 """ntc_templates.parse."""
 
 import os
+from concurrent.futures import ProcessPoolExecutor
 
 # Due to TextFSM library issues on Windows, it is better to not fail on import
 # Instead fail at runtime (i.e. if method is actually used).
@@ -30,14 +31,19 @@ def _get_template_dir():
 
 def _clitable_to_dict(cli_table):
     """Convert TextFSM cli_table object to list of dictionaries."""
-    objs = []
-    for row in cli_table:
-        temp_dict = {}
-        for index, element in enumerate(row):
-            temp_dict[cli_table.header[index].lower()] = element
-        objs.append(temp_dict)
+    header = [column.lower() for column in cli_table.header]
+    return [dict(zip(header, row)) for row in cli_table]
 
-    return objs
+
+def _check_clitable():
+    if not HAS_CLITABLE:
+        msg = (
+            "The TextFSM library is not currently supported on Windows. If you are NOT using Windows "
+            "you should be able to 'pip install textfsm' to fix this issue. If you are using Windows "
+            "then you will need to install the patch referenced here:\n\n"
+            "https://github.com/google/textfsm/pull/82\n\n"
+        )
+        raise ImportError(msg)
 
 
 def parse_output(
@@ -61,14 +67,7 @@ def parse_output(
     Returns:
         list: The TextFSM table entries as dictionaries.
     """
-    if not HAS_CLITABLE:
-        msg = (
-            "The TextFSM library is not currently supported on Windows. If you are NOT using Windows "
-            "you should be able to 'pip install textfsm' to fix this issue. If you are using Windows "
-            "then you will need to install the patch referenced here:\n\n"
-            "https://github.com/google/textfsm/pull/82\n\n"
-        )
-        raise ImportError(msg)
+    _check_clitable()
 
     template_dir = template_dir or _get_template_dir()
     cli_table = clitable.CliTable("index", template_dir)
@@ -82,3 +81,108 @@ def parse_output(
         raise ParsingException(f'Unable to parse command "{command}" on platform {platform} - {str(err)}') from err
 
     return structured_data
+
+
+def _resolve_template(cli_table, platform, command):
+    """Return the template string from the index that matches platform and command."""
+    attrs = {"Command": command, "Platform": platform}
+    row_idx = cli_table.index.GetRowMatch(attrs)
+    if not row_idx:
+        raise clitable.CliTableError(f'No template found for attributes: "{attrs}"')
+    return cli_table.index.index[row_idx]["Template"]
+
+
+def _parse_group(template_dir, templates, outputs):
+    """Parse a list of outputs that all resolved to the same template(s).
+
+    Returns:
+        list: One list of dictionaries per entry in `outputs`.
+    """
+    cli_table = clitable.CliTable("index", template_dir)
+    if ":" in templates:
+        # Merging the tables of several templates is left to CliTable.
+        results = []
+        for data in outputs:
+            cli_table.ParseCmd(data, templates=templates)
+            results.append(_clitable_to_dict(cli_table))
+        return results
+
+    # A single template: reset and reuse one FSM for the whole group.
+    fsm = cli_table._TemplateNamesToFsms(templates)[0]
+    header = [column.lower() for column in fsm.header]
+    results = []
+    for data in outputs:
+        fsm.Reset()
+        results.append([dict(zip(header, record)) for record in fsm.ParseText(data)])
+    return results
+
+
+def parse_outputs(items, template_dir=None, try_fallback=False, processes=None, chunk_size=1000):
+    """Return the structured data for many outputs from network devices.
+
+    The index is read once, the items are grouped by the template they resolve to and
+    each group is parsed with a single compiled FSM.
+
+    Args:
+        items: Iterable of `(platform, command, data)` tuples, see `parse_output`.
+        template_dir: The directory to look for TextFSM templates.
+            Defaults to setting of environment variable or default ntc-templates dir.
+            The specified directory must have a properly configured index file.
+        try_fallback: Whether to fallback to using the default template directory for
+            items that have no template in `template_dir`.
+        processes: Number of worker processes to parse with. The default of `None`
+            parses in the current process.
+        chunk_size: Maximum number of outputs sent to a worker process at a time.
+
+    Returns:
+        list: One list of TextFSM table entries as dictionaries per item, in the same
+            order as `items`.
+    """
+    _check_clitable()
+
+    default_dir = _get_template_dir()
+    template_dir = template_dir or default_dir
+    cli_tables = {template_dir: clitable.CliTable("index", template_dir)}
+
+    # (template_dir, templates) -> ([item positions], [outputs])
+    groups = {}
+    count = 0
+    for position, (platform, command, data) in enumerate(items):
+        count += 1
+        try:
+            key = (template_dir, _resolve_template(cli_tables[template_dir], platform, command))
+        except clitable.CliTableError as err:
+            if not (try_fallback and template_dir != default_dir):
+                raise ParsingException(
+                    f'Unable to parse command "{command}" on platform {platform} - {str(err)}'
+                ) from err
+            if default_dir not in cli_tables:
+                cli_tables[default_dir] = clitable.CliTable("index", default_dir)
+            try:
+                key = (default_dir, _resolve_template(cli_tables[default_dir], platform, command))
+            except clitable.CliTableError as fallback_err:
+                raise ParsingException(
+                    f'Unable to parse command "{command}" on platform {platform} - {str(fallback_err)}'
+                ) from fallback_err
+        positions, outputs = groups.setdefault(key, ([], []))
+        positions.append(position)
+        outputs.append(data)
+
+    results = [None] * count
+    if not processes:
+        for (group_dir, templates), (positions, outputs) in groups.items():
+            for position, structured_data in zip(positions, _parse_group(group_dir, templates, outputs)):
+                results[position] = structured_data
+        return results
+
+    with ProcessPoolExecutor(max_workers=processes) as executor:
+        futures = []
+        for (group_dir, templates), (positions, outputs) in groups.items():
+            for start in range(0, len(outputs), chunk_size):
+                future = executor.submit(_parse_group, group_dir, templates, outputs[start : start + chunk_size])
+                futures.append((positions[start : start + chunk_size], future))
+        for positions, future in futures:
+            for position, structured_data in zip(positions, future.result()):
+                results[position] = structured_data
+
+    return results
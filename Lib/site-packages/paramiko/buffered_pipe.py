@@ -22,7 +22,7 @@ read from and closed, but is reading from a buffer fed by another thread.  The
 read operations are blocking and can have a timeout set.
 """
 
-import array
+from collections import deque
 import threading
 import time
 from paramiko.util import b
@@ -41,20 +41,70 @@ class BufferedPipe:
     A buffer that obeys normal read (with timeout) & close semantics for a
     file or socket, but is fed data from another thread.  This is used by
     `.Channel`.
+
+    Fed data is kept as a queue of chunks, so reading part of the buffer never
+    shifts the data that remains.
     """
 
     def __init__(self):
         self._lock = threading.Lock()
         self._cv = threading.Condition(self._lock)
         self._event = None
-        self._buffer = array.array("B")
+        # Chunks of fed data; the first one is consumed from self._offset on.
+        self._buffer = deque()
+        self._offset = 0
+        self._size = 0
         self._closed = False
 
     def _buffer_frombytes(self, data):
-        self._buffer.frombytes(data)
+        if data:
+            self._buffer.append(data)
+            self._size += len(data)
 
     def _buffer_tobytes(self, limit=None):
-        return self._buffer[:limit].tobytes()
+        """
+        Remove and return up to ``limit`` bytes (all if ``None``) from the
+        front of the buffer.
+        """
+        if limit is None or limit >= self._size:
+            limit = self._size
+        chunks = []
+        while limit > 0:
+            chunk = self._buffer[0]
+            available = len(chunk) - self._offset
+            if available <= limit:
+                chunks.append(memoryview(chunk)[self._offset :])
+                self._buffer.popleft()
+                self._offset = 0
+                limit -= available
+            else:
+                end = self._offset + limit
+                chunks.append(memoryview(chunk)[self._offset : end])
+                self._offset = end
+                limit = 0
+        out = b"".join(chunks)
+        self._size -= len(out)
+        return out
+
+    def _buffer_toview(self, view):
+        """
+        Move bytes from the front of the buffer into the writable memoryview
+        ``view``, returning the number of bytes copied.
+        """
+        copied = 0
+        while copied < len(view) and self._buffer:
+            chunk = self._buffer[0]
+            count = min(len(chunk) - self._offset, len(view) - copied)
+            view[copied : copied + count] = memoryview(chunk)[
+                self._offset : self._offset + count
+            ]
+            copied += count
+            self._offset += count
+            if self._offset == len(chunk):
+                self._buffer.popleft()
+                self._offset = 0
+        self._size -= copied
+        return copied
 
     def set_event(self, event):
         """
@@ -72,7 +122,7 @@ class BufferedPipe:
             # nothing will ever call `.feed` and the event (& OS pipe, if we're
             # wrapping one - see `Channel.fileno`) will permanently stay in
             # `clear`, causing deadlock if e.g. `select`ed upon.
-            if self._closed or len(self._buffer) > 0:
+            if self._closed or self._size > 0:
                 event.set()
             else:
                 event.clear()
@@ -90,7 +140,7 @@ class BufferedPipe:
         try:
             if self._event is not None:
                 self._event.set()
-            self._buffer_frombytes(b(data))
+            self._buffer_frombytes(bytes(b(data)))
             self._cv.notify_all()
         finally:
             self._lock.release()
@@ -107,7 +157,7 @@ class BufferedPipe:
         """
         self._lock.acquire()
         try:
-            if len(self._buffer) == 0:
+            if self._size == 0:
                 return False
             return True
         finally:
@@ -134,39 +184,79 @@ class BufferedPipe:
             `.PipeTimeout` -- if a timeout was specified and no data was ready
             before that timeout
         """
-        out = bytes()
         self._lock.acquire()
         try:
-            if len(self._buffer) == 0:
-                if self._closed:
-                    return out
-                # should we block?
-                if timeout == 0.0:
-                    raise PipeTimeout()
-                # loop here in case we get woken up but a different thread has
-                # grabbed everything in the buffer.
-                while (len(self._buffer) == 0) and not self._closed:
-                    then = time.time()
-                    self._cv.wait(timeout)
-                    if timeout is not None:
-                        timeout -= time.time() - then
-                        if timeout <= 0.0:
-                            raise PipeTimeout()
+            if not self._wait_for_data(timeout):
+                return bytes()
 
             # something's in the buffer and we have the lock!
-            if len(self._buffer) <= nbytes:
-                out = self._buffer_tobytes()
-                del self._buffer[:]
-                if (self._event is not None) and not self._closed:
-                    self._event.clear()
-            else:
-                out = self._buffer_tobytes(nbytes)
-                del self._buffer[:nbytes]
+            out = self._buffer_tobytes(nbytes)
+            self._clear_event_if_empty()
         finally:
             self._lock.release()
 
         return out
 
+    def readinto(self, buffer, timeout=None):
+        """
+        Read data from the pipe directly into ``buffer``, a writable
+        bytes-like object (e.g. a `bytearray` or `memoryview`).  At most
+        ``len(buffer)`` bytes are read.  A return value of zero means the pipe
+        has been closed.
+
+        Blocking and ``timeout`` behave as for `read`.
+
+        :param buffer: writable bytes-like object to read into
+        :param float timeout:
+            maximum seconds to wait (or ``None``, the default, to wait forever)
+        :return: number (`int`) of bytes read
+
+        :raises:
+            `.PipeTimeout` -- if a timeout was specified and no data was ready
+            before that timeout
+        """
+        view = memoryview(buffer).cast("B")
+        self._lock.acquire()
+        try:
+            if not self._wait_for_data(timeout):
+                return 0
+
+            # something's in the buffer and we have the lock!
+            count = self._buffer_toview(view)
+            self._clear_event_if_empty()
+        finally:
+            self._lock.release()
+
+        return count
+
+    def _wait_for_data(self, timeout):
+        """
+        Wait (with the lock held) until data is buffered.  Returns ``False``
+        if the pipe is closed and empty.
+        """
+        if self._size == 0:
+            if self._closed:
+                return False
+            # should we block?
+            if timeout == 0.0:
+                raise PipeTimeout()
+            # loop here in case we get woken up but a different thread has
+            # grabbed everything in the buffer.
+            while (self._size == 0) and not self._closed:
+                then = time.time()
+                self._cv.wait(timeout)
+                if timeout is not None:
+                    timeout -= time.time() - then
+                    if timeout <= 0.0:
+                        raise PipeTimeout()
+            if self._size == 0:
+                return False
+        return True
+
+    def _clear_event_if_empty(self):
+        if self._size == 0 and (self._event is not None) and not self._closed:
+            self._event.clear()
+
     def empty(self):
         """
         Clear out the buffer and return all data that was in it.
@@ -178,7 +268,6 @@ class BufferedPipe:
         self._lock.acquire()
         try:
             out = self._buffer_tobytes()
-            del self._buffer[:]
             if (self._event is not None) and not self._closed:
                 self._event.clear()
             return out
@@ -207,6 +296,6 @@ class BufferedPipe:
         """
         self._lock.acquire()
         try:
-            return len(self._buffer)
+            return self._size
         finally:
             self._lock.release()
@@ -709,6 +709,39 @@ class Channel(ClosingContextManager):
 
         return out
 
+    def recv_into(self, buffer, nbytes=0):
+        """
+        Receive data from the channel directly into ``buffer``, a writable
+        bytes-like object, avoiding an intermediate `bytes` copy.  At most
+        ``nbytes`` bytes (or ``len(buffer)`` if ``nbytes`` is 0) are read.  A
+        return value of zero means the channel stream has closed.
+
+        :param buffer: writable bytes-like object to receive into.
+        :param int nbytes: maximum number of bytes to read.
+        :return: number (`int`) of bytes received.
+
+        :raises socket.timeout:
+            if no data is ready before the timeout set by `settimeout`.
+        """
+        view = memoryview(buffer).cast("B")
+        if nbytes:
+            view = view[:nbytes]
+        try:
+            count = self.in_buffer.readinto(view, self.timeout)
+        except PipeTimeout:
+            raise socket.timeout()
+
+        ack = self._check_add_window(count)
+        # no need to hold the channel lock when sending this
+        if ack > 0:
+            m = Message()
+            m.add_byte(cMSG_CHANNEL_WINDOW_ADJUST)
+            m.add_int(self.remote_chanid)
+            m.add_int(ack)
+            self.transport._send_user_message(m)
+
+        return count
+
     def recv_stderr_ready(self):
         """
         Returns true if data is buffered and ready to be read from this
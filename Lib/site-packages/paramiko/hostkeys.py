@@ -25,6 +25,7 @@ import re
 from collections.abc import MutableMapping
 from hashlib import sha1
 from hmac import HMAC
+import hmac
 
 
 from paramiko.pkey import PKey, UnknownKeyType
@@ -53,6 +54,7 @@ class HostKeys(MutableMapping):
         """
         # emulate a dict of { hostname: { keytype: PKey } }
         self._entries = []
+        self._reset_index()
         if filename is not None:
             self.load(filename)
 
@@ -65,11 +67,11 @@ class HostKeys(MutableMapping):
         :param str keytype: key type (``"ssh-rsa"`` or ``"ssh-dss"``)
         :param .PKey key: the key to add
         """
-        for e in self._entries:
-            if (hostname in e.hostnames) and (e.key.get_name() == keytype):
+        for e in self._index.get(hostname, ()):
+            if e.key.get_name() == keytype:
                 e.key = key
                 return
-        self._entries.append(HostKeyEntry([hostname], key))
+        self._add_entry(HostKeyEntry([hostname], key))
 
     def load(self, filename):
         """
@@ -101,7 +103,7 @@ class HostKeys(MutableMapping):
                         if self.check(h, entry.key):
                             entry.hostnames.remove(h)
                     if len(entry.hostnames):
-                        self._entries.append(entry)
+                        self._add_entry(entry)
 
     def save(self, filename):
         """
@@ -172,7 +174,7 @@ class HostKeys(MutableMapping):
                     # add a new one
                     e = HostKeyEntry([hostname], val)
                     self._entries.append(e)
-                    self._hostkeys._entries.append(e)
+                    self._hostkeys._add_entry(e)
 
             def keys(self):
                 return [
@@ -181,14 +183,129 @@ class HostKeys(MutableMapping):
                     if e.key is not None
                 ]
 
-        entries = []
-        for e in self._entries:
-            if self._hostname_matches(hostname, e):
-                entries.append(e)
+        entries = self._matching_entries(hostname)
         if len(entries) == 0:
             return None
         return SubDict(hostname, entries, self)
 
+    def _reset_index(self):
+        # hostname as written in the file (plain or hashed) -> [entries]
+        self._index = {}
+        # salt of the hashed hostnames -> {HMAC digest: hashed hostname}
+        self._hashed = {}
+        # salt -> decoded salt, filled in on first use
+        self._salt_bytes = {}
+        # plain hostname -> matching hashed hostnames, until _hashed changes
+        self._hashed_matches = {}
+        # id(entry) -> insertion sequence number, to keep lookups in file order
+        self._order = {}
+        self._next_order = 0
+
+    def _add_entry(self, entry):
+        """
+        Append ``entry`` to the table and index its hostnames.
+        """
+        self._entries.append(entry)
+        self._order[id(entry)] = self._next_order
+        self._next_order += 1
+        for h in entry.hostnames:
+            self._index.setdefault(h, []).append(entry)
+            hashed = self._split_hashed(h)
+            if hashed is not None:
+                salt, digest = hashed
+                self._hashed.setdefault(salt, {})[digest] = h
+                self._hashed_matches.clear()
+
+    def _remove_entry(self, entry):
+        """
+        Remove ``entry`` from the table and from the index.
+        """
+        self._entries.remove(entry)
+        del self._order[id(entry)]
+        for h in entry.hostnames:
+            entries = self._index[h]
+            entries.remove(entry)
+            if entries:
+                continue
+            del self._index[h]
+            hashed = self._split_hashed(h)
+            if hashed is not None:
+                salt, digest = hashed
+                digests = self._hashed[salt]
+                del digests[digest]
+                self._hashed_matches.clear()
+                if not digests:
+                    del self._hashed[salt]
+                    self._salt_bytes.pop(salt, None)
+
+    @staticmethod
+    def _split_hashed(hostname):
+        """
+        Return ``(salt, HMAC digest)`` of a hashed hostname in the form
+        written by `hash_host`, or ``None`` for anything else.
+        """
+        if not hostname.startswith("|1|"):
+            return None
+        fields = hostname.split("|")
+        if len(fields) != 4:
+            return None
+        try:
+            digest = decodebytes(b(fields[3]))
+        except binascii.Error:
+            return None
+        if u(encodebytes(digest)).replace("\n", "") != fields[3]:
+            return None
+        return fields[2], digest
+
+    @staticmethod
+    def _decode_salt(salt):
+        # Same checks as hash_host
+        salt_bytes = decodebytes(b(salt))
+        assert len(salt_bytes) == sha1().digest_size
+        if u(encodebytes(salt_bytes)).replace("\n", "") != salt:
+            # hash_host writes this salt differently, so nothing can match it
+            return None
+        return salt_bytes
+
+    def _hashed_hostnames(self, hostname):
+        """
+        Return the hashed hostnames in the table that ``hostname`` hashes to.
+        """
+        matches = self._hashed_matches.get(hostname)
+        if matches is not None:
+            return matches
+        matches = []
+        hostname_bytes = b(hostname)
+        for salt, digests in self._hashed.items():
+            if salt in self._salt_bytes:
+                salt_bytes = self._salt_bytes[salt]
+            else:
+                salt_bytes = self._decode_salt(salt)
+                self._salt_bytes[salt] = salt_bytes
+            if salt_bytes is None:
+                continue
+            h = digests.get(hmac.digest(salt_bytes, hostname_bytes, "sha1"))
+            if h is not None:
+                matches.append(h)
+        self._hashed_matches[hostname] = matches
+        return matches
+
+    def _matching_entries(self, hostname):
+        """
+        Return the entries that match ``hostname`` (see `_hostname_matches`),
+        in table order.  Only one HMAC is computed per distinct salt.
+        """
+        entries = list(self._index.get(hostname, ()))
+        if not hostname.startswith("|1|"):
+            for h in self._hashed_hostnames(hostname):
+                entries.extend(self._index[h])
+            if len(entries) > 1:
+                unique = {id(e): e for e in entries}
+                entries = sorted(
+                    unique.values(), key=lambda e: self._order[id(e)]
+                )
+        return entries
+
     def _hostname_matches(self, hostname, entry):
         """
         Tests whether ``hostname`` string matches given SubDict ``entry``.
@@ -215,19 +332,18 @@ class HostKeys(MutableMapping):
         :return:
             ``True`` if the key is associated with the hostname; else ``False``
         """
-        k = self.lookup(hostname)
-        if k is None:
-            return False
-        host_key = k.get(key.get_name(), None)
-        if host_key is None:
-            return False
-        return host_key.asbytes() == key.asbytes()
+        key_type = key.get_name()
+        for e in self._matching_entries(hostname):
+            if e.key is not None and e.key.get_name() == key_type:
+                return e.key.asbytes() == key.asbytes()
+        return False
 
     def clear(self):
         """
         Remove all host keys from the dictionary.
         """
         self._entries = []
+        self._reset_index()
 
     def __iter__(self):
         for k in self.keys():
@@ -243,37 +359,32 @@ class HostKeys(MutableMapping):
         return ret
 
     def __delitem__(self, key):
-        index = None
-        for i, entry in enumerate(self._entries):
-            if self._hostname_matches(key, entry):
-                index = i
-                break
-        if index is None:
+        entries = self._matching_entries(key)
+        if not entries:
             raise KeyError(key)
-        self._entries.pop(index)
+        self._remove_entry(entries[0])
 
     def __setitem__(self, hostname, entry):
         # don't use this please.
         if len(entry) == 0:
-            self._entries.append(HostKeyEntry([hostname], None))
+            self._add_entry(HostKeyEntry([hostname], None))
             return
         for key_type in entry.keys():
             found = False
-            for e in self._entries:
-                if (hostname in e.hostnames) and e.key.get_name() == key_type:
+            for e in self._index.get(hostname, ()):
+                if e.key.get_name() == key_type:
                     # replace
                     e.key = entry[key_type]
                     found = True
             if not found:
-                self._entries.append(HostKeyEntry([hostname], entry[key_type]))
+                self._add_entry(HostKeyEntry([hostname], entry[key_type]))
 
     def keys(self):
-        ret = []
+        ret = {}
         for e in self._entries:
             for h in e.hostnames:
-                if h not in ret:
-                    ret.append(h)
-        return ret
+                ret[h] = None
+        return list(ret)
 
     def values(self):
         ret = []
@@ -86,6 +86,8 @@ class Packetizer:
         self.__need_rekey = False
         self.__init_count = 0
         self.__remainder = bytes()
+        # reusable receive buffer for read_message
+        self.__read_buf = bytearray(4096)
         self._initial_kex_done = False
 
         # used for noticing when to re-key:
@@ -308,22 +310,46 @@ class Packetizer:
             ``EOFError`` -- if the socket was closed before all the bytes could
             be read
         """
-        out = bytes()
+        out = bytearray(n)
+        self.read_into(out, check_rekey=check_rekey)
+        return bytes(out)
+
+    def read_into(self, buffer, check_rekey=False):
+        """
+        Fill ``buffer`` (a writable bytes-like object), blocking as long as
+        necessary.
+
+        :param buffer: the buffer to fill
+        :return: the number of bytes read (always ``len(buffer)``)
+
+        :raises:
+            ``EOFError`` -- if the socket was closed before all the bytes could
+            be read
+        """
+        view = memoryview(buffer).cast("B")
+        n = len(view)
+        pos = 0
         # handle over-reading from reading the banner line
         if len(self.__remainder) > 0:
-            out = self.__remainder[:n]
-            self.__remainder = self.__remainder[n:]
-            n -= len(out)
-        while n > 0:
+            pos = min(n, len(self.__remainder))
+            view[:pos] = self.__remainder[:pos]
+            self.__remainder = self.__remainder[pos:]
+        # sockets (but not e.g. a ProxyCommand) can receive without a copy
+        recv_into = getattr(self.__socket, "recv_into", None)
+        while pos < n:
             got_timeout = False
             if self.handshake_timed_out():
                 raise EOFError()
             try:
-                x = self.__socket.recv(n)
-                if len(x) == 0:
+                if recv_into is not None:
+                    count = recv_into(view[pos:], n - pos)
+                else:
+                    x = self.__socket.recv(n - pos)
+                    count = len(x)
+                    view[pos : pos + count] = x
+                if count == 0:
                     raise EOFError()
-                out += x
-                n -= len(x)
+                pos += count
             except socket.timeout:
                 got_timeout = True
             except socket.error as e:
@@ -340,10 +366,21 @@ class Packetizer:
             if got_timeout:
                 if self.__closed:
                     raise EOFError()
-                if check_rekey and (len(out) == 0) and self.__need_rekey:
+                if check_rekey and (pos == 0) and self.__need_rekey:
                     raise NeedRekeyException()
                 self._check_keepalive()
-        return out
+        return pos
+
+    def _read_buffer(self, n, keep=0):
+        """
+        Return a writable view of at least ``n`` bytes of the reusable receive
+        buffer, preserving its first ``keep`` bytes if it has to grow.
+        """
+        if len(self.__read_buf) < n:
+            new_buf = bytearray(max(n, 2 * len(self.__read_buf)))
+            new_buf[:keep] = self.__read_buf[:keep]
+            self.__read_buf = new_buf
+        return memoryview(self.__read_buf)
 
     def write_all(self, out):
         self.__keepalive_last = time.time()
@@ -493,12 +530,19 @@ class Packetizer:
         :raises: `.SSHException` -- if the packet is mangled
         :raises: `.NeedRekeyException` -- if the transport should rekey
         """
-        header = self.read_all(self.__block_size_in, check_rekey=True)
+        # The whole packet is received into the reusable read buffer and the
+        # cipher/MAC engines are handed views of it rather than copies.
+        block_size = self.__block_size_in
+        buf = self._read_buffer(block_size)
+        self.read_into(buf[:block_size], check_rekey=True)
+        header = buf[:block_size]
         if self.__etm_in:
             packet_size = struct.unpack(">I", header[:4])[0]
-            remaining = packet_size - self.__block_size_in + 4
-            packet = header[4:] + self.read_all(remaining, check_rekey=False)
-            mac = self.read_all(self.__mac_size_in, check_rekey=False)
+            total = 4 + packet_size + self.__mac_size_in
+            buf = self._read_buffer(total, keep=block_size)
+            self.read_into(buf[block_size:total], check_rekey=False)
+            packet = buf[4 : 4 + packet_size]
+            mac = buf[4 + packet_size : total]
             mac_payload = (
                 struct.pack(">II", self.__sequence_number_in, packet_size)
                 + packet
@@ -514,19 +558,20 @@ class Packetizer:
             # Grab unencrypted (considered 'additional data' under GCM) packet
             # length.
             packet_size = struct.unpack(">I", header[:4])[0]
-            aad = header[:4]
-            remaining = (
-                packet_size - self.__block_size_in + 4 + self.__mac_size_in
+            aad = bytes(header[:4])
+            total = 4 + packet_size + self.__mac_size_in
+            buf = self._read_buffer(total, keep=block_size)
+            self.read_into(buf[block_size:total], check_rekey=False)
+            header = self.__block_engine_in.decrypt(
+                self.__iv_in, buf[4:total], aad
             )
-            packet = header[4:] + self.read_all(remaining, check_rekey=False)
-            header = self.__block_engine_in.decrypt(self.__iv_in, packet, aad)
 
             self.__iv_in = self._inc_iv_counter(self.__iv_in)
 
         if self.__block_engine_in is not None and not self.__aead_in:
             header = self.__block_engine_in.update(header)
         if self.__dump_packets:
-            self._log(DEBUG, util.format_binary(header, "IN: "))
+            self._log(DEBUG, util.format_binary(bytes(header), "IN: "))
 
         # When ETM or AEAD (GCM) are in use, we've already read the packet size
         # & decrypted everything, so just set the packet back to the header we
@@ -540,17 +585,18 @@ class Packetizer:
             # leftover contains decrypted bytes from the first block (after the
             # length field)
             leftover = header[4:]
-            if (packet_size - len(leftover)) % self.__block_size_in != 0:
+            if (packet_size - len(leftover)) % block_size != 0:
                 raise SSHException("Invalid packet blocking")
-            buf = self.read_all(
-                packet_size + self.__mac_size_in - len(leftover)
-            )
-            packet = buf[: packet_size - len(leftover)]
-            post_packet = buf[packet_size - len(leftover) :]
+            body_size = packet_size - len(leftover)
+            total = block_size + body_size + self.__mac_size_in
+            buf = self._read_buffer(total, keep=block_size)
+            self.read_into(buf[block_size:total])
+            packet = buf[block_size : block_size + body_size]
+            post_packet = buf[block_size + body_size : total]
 
             if self.__block_engine_in is not None:
                 packet = self.__block_engine_in.update(packet)
-            packet = leftover + packet
+            packet = b"".join((leftover, packet))
 
         if self.__dump_packets:
             self._log(DEBUG, util.format_binary(packet, "IN: "))
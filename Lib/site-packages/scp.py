@@ -7,6 +7,8 @@ Utilities for sending files over ssh using the scp1 protocol.
 
 __version__ = '0.15.0'
 
+import hashlib
+import json
 import locale
 import os
 import re
@@ -15,6 +17,9 @@ from socket import timeout as SocketTimeout
 
 SCP_COMMAND = b'scp'
 
+# Suffix of the checkpoint file written next to a download that was interrupted
+PARTIAL_SUFFIX = '.scp-partial'
+
 PATH_TYPES = (str, bytes)
 
 try:
@@ -100,6 +105,50 @@ def asunicode_win(s):
         return s
 
 
+def partial_download(local_path):
+    """Return the checkpoint of an interrupted download of local_path, or None.
+
+    The checkpoint is a dict with the size of the remote file, the number of
+    bytes received and the MD5 of those bytes. It is kept in a file next to
+    local_path, so a new connection (or process) can resume the download.
+    """
+    try:
+        with open(asunicode(local_path) + PARTIAL_SUFFIX) as f:
+            return json.load(f)
+    except (IOError, ValueError):
+        return None
+
+
+def _file_md5(path, length):
+    """MD5 of the first length bytes of a local file."""
+    file_hash = hashlib.md5()
+    with open(path, 'rb') as f:
+        while length > 0:
+            data = f.read(min(length, 1024 * 1024))
+            if not data:
+                break
+            file_hash.update(data)
+            length -= len(data)
+    return file_hash.hexdigest()
+
+
+def _save_partial_download(local_path, size, received):
+    """Write (or remove, once complete) the checkpoint of a download."""
+    checkpoint_path = asunicode(local_path) + PARTIAL_SUFFIX
+    try:
+        if received >= size:
+            if os.path.exists(checkpoint_path):
+                os.remove(checkpoint_path)
+            return
+        checkpoint = {'size': size, 'received': received,
+                      'md5': _file_md5(local_path, received)}
+        with open(checkpoint_path, 'w') as f:
+            json.dump(checkpoint, f)
+    except (IOError, OSError):
+        # The checkpoint is only an optimization, never hide the real error
+        pass
+
+
 class SCPClient(object):
     """
     An scp1 implementation, compatible with openssh scp.
@@ -490,6 +539,9 @@ class SCPClient(object):
             else:
                 self._progress(path, size, 0, self.peername)
         buff_size = self.buff_size
+        recv_into = getattr(chan, 'recv_into', None)
+        if recv_into is not None:
+            buff = memoryview(bytearray(buff_size))
         pos = 0
         chan.send(b'\x00')
         try:
@@ -497,11 +549,15 @@ class SCPClient(object):
                 # we have to make sure we don't read the final byte
                 if size - pos <= buff_size:
                     buff_size = size - pos
-                data = chan.recv(buff_size)
+                if recv_into is not None:
+                    nbytes = recv_into(buff, buff_size)
+                    data = buff[:nbytes]
+                else:
+                    data = chan.recv(buff_size)
                 if not data:
                     raise SCPException("Underlying channel was closed")
                 file_hdl.write(data)
-                pos = file_hdl.tell()
+                pos += len(data)
                 if self._progress:
                     self._progress(path, size, pos, self.peername)
             msg = chan.recv(512)
@@ -518,8 +574,107 @@ class SCPClient(object):
             raise SCPException('Error receiving, socket.timeout')
         finally:
             file_hdl.close()
+            # Checkpoint what was received so the download can be resumed
+            _save_partial_download(path, size, pos)
         # '\x00' confirmation sent in _recv_all
 
+    def resume_get(self, remote_path, local_path, readv_size=32768,
+                   readv_batch=1024):
+        # type: (PathTypes, Union[str, bytes], int, int) -> None
+        """
+        Complete an interrupted download of a single file over SFTP.
+
+        The checkpoint left next to local_path by the interrupted get() or
+        resume_get() (see partial_download()) is checked first: the remote
+        file must have the same size, the MD5 of the local bytes must match
+        the checkpoint and the last block before the resume offset must be
+        the same in both files. Then only the rest of the file is fetched,
+        with pipelined SFTP reads. Otherwise the download starts over.
+
+        Raises SCPException before anything is transferred if the remote
+        host does not support SFTP or the file can't be opened over SFTP,
+        the caller can fall back to a full get().
+
+        @param remote_path: path of the file on the remote host
+        @type remote_path: str
+        @param local_path: path of the partially downloaded local file
+        @type local_path: str
+        @param readv_size: size of each SFTP read request
+        @type readv_size: int
+        @param readv_batch: number of read requests in flight per batch, bounds
+            the memory used for data that is not written yet
+        @type readv_batch: int
+        """
+        from paramiko import SFTPClient, SSHException
+
+        local_path = asunicode(local_path)
+        try:
+            sftp = SFTPClient.from_transport(self.transport)
+        except (SSHException, EOFError) as e:
+            raise SCPException('SFTP is not available: %s' % e)
+        try:
+            try:
+                remote_file = sftp.open(asunicode(remote_path), 'rb')
+                size = remote_file.stat().st_size
+            except IOError as e:
+                raise SCPException('Cannot open %s over SFTP: %s' %
+                                   (asunicode(remote_path), e))
+            with remote_file:
+                offset = self._resume_offset(remote_file, local_path, size,
+                                             readv_size)
+                file_hdl = open(local_path, 'r+b' if offset else 'wb')
+                try:
+                    file_hdl.seek(offset)
+                    file_hdl.truncate()
+                    if self._progress:
+                        if size == 0:
+                            # avoid divide-by-zero
+                            self._progress(local_path, 1, 1, self.peername)
+                        else:
+                            self._progress(local_path, size, offset,
+                                           self.peername)
+                    while offset < size:
+                        chunks = []
+                        for chunk_offset in range(offset, size, readv_size):
+                            chunks.append((chunk_offset,
+                                           min(readv_size, size - chunk_offset)))
+                            if len(chunks) == readv_batch:
+                                break
+                        for data in remote_file.readv(chunks):
+                            file_hdl.write(data)
+                            offset += len(data)
+                            if self._progress:
+                                self._progress(local_path, size, offset,
+                                               self.peername)
+                finally:
+                    file_hdl.close()
+                    _save_partial_download(local_path, size, offset)
+        finally:
+            sftp.close()
+
+    @staticmethod
+    def _resume_offset(remote_file, local_path, size, check_size):
+        """Offset a download can resume from, 0 to start over."""
+        checkpoint = partial_download(local_path)
+        if not checkpoint or checkpoint.get('size') != size:
+            return 0
+        offset = checkpoint.get('received', 0)
+        if not 0 < offset <= size or not os.path.exists(local_path) or \
+                os.path.getsize(local_path) < offset:
+            return 0
+        # The local bytes are still the ones that were received
+        if _file_md5(local_path, offset) != checkpoint.get('md5'):
+            return 0
+        # ...and the remote file still has them where the download resumes
+        check_size = min(offset, check_size)
+        remote_file.seek(offset - check_size)
+        remote_data = remote_file.read(check_size)
+        with open(local_path, 'rb') as local_file:
+            local_file.seek(offset - check_size)
+            if local_file.read(check_size) != remote_data:
+                return 0
+        return offset
+
     def _recv_pushd(self, cmd):
         parts = cmd.split(b' ', 2)
         try:
@@ -65,6 +65,9 @@ class IndexTable(object):
     compiled: TextTable, the table but with compiled regexp for each field.
   """
 
+  # Column used to pre-select candidate rows in GetRowMatch.
+  BUCKET_COLUMN = 'Platform'
+
   def __init__(self, preread=None, precompile=None, file_path=None):
     """Create new IndexTable object.
 
@@ -75,6 +78,7 @@ class IndexTable(object):
     """
     self.index = None
     self.compiled = None
+    self._ResetLookupCache()
     if file_path:
       self._index_file = file_path
       self._index_handle = open(self._index_file, 'r')
@@ -99,6 +103,9 @@ class IndexTable(object):
 
     clone.index = self.index
     clone.compiled = self.compiled
+    # pylint: disable=protected-access
+    clone._buckets = self._buckets
+    clone._matches = self._matches
     return clone
 
   def __deepcopy__(self, memodict=None):
@@ -142,9 +149,58 @@ class IndexTable(object):
         if row[col]:
           row[col] = copyable_regex_object.CopyableRegexObject(row[col])
 
+    self._ResetLookupCache()
+
+  def _ResetLookupCache(self):
+    """Clears the memoized GetRowMatch lookups."""
+    # Candidate rows per value of the BUCKET_COLUMN attribute.
+    self._buckets = {}
+    # Row number per set of attributes.
+    self._matches = {}
+
+  def _BucketRows(self, bucket_value):
+    """Returns the rows that can match the BUCKET_COLUMN attribute value.
+
+    Rows with a literal value in the BUCKET_COLUMN are only kept if the value
+    matches, rows using a regexp are always kept. Row order is preserved.
+    """
+    rows = self._buckets.get(bucket_value)
+    if rows is None:
+      rows = []
+      for row in self.compiled:
+        cell = row[self.BUCKET_COLUMN]
+        if (cell and re.escape(cell.pattern) == cell.pattern and
+            not bucket_value.startswith(cell.pattern)):
+          continue
+        rows.append(row)
+      self._buckets[bucket_value] = rows
+    return rows
+
   def GetRowMatch(self, attributes):
     """Returns the row number that matches the supplied attributes."""
-    for row in self.compiled:
+    try:
+      cache_key = tuple(sorted(attributes.items()))
+      hash(cache_key)
+    except TypeError:
+      cache_key = None
+    if cache_key is not None and cache_key in self._matches:
+      return self._matches[cache_key]
+
+    bucket_value = attributes.get(self.BUCKET_COLUMN)
+    if (isinstance(bucket_value, str) and
+        self.BUCKET_COLUMN in self.compiled.header):
+      rows = self._BucketRows(bucket_value)
+    else:
+      rows = self.compiled
+
+    row_idx = self._RowMatch(rows, attributes)
+    if cache_key is not None:
+      self._matches[cache_key] = row_idx
+    return row_idx
+
+  def _RowMatch(self, rows, attributes):
+    """Returns the number of the first row that matches the attributes."""
+    for row in rows:
       try:
         for key in attributes:
           # Silently skip attributes not present in the index file.
@@ -179,6 +235,9 @@ class CliTable(texttable.TextTable):
   # Without this, the regexes are parsed at every call to CliTable().
   _lock = threading.Lock()
   INDEX = {}
+  # Compiled templates shared across all instances, keyed by (path, mtime).
+  # Each parse works on a clone so the cached FSMs are never mutated.
+  FSM = {}
 
   def synchronised(func):
     """Synchronisation decorator."""
@@ -247,6 +306,26 @@ class CliTable(texttable.TextTable):
 
     return template_files
 
+  def _TemplateNamesToFsms(self, template_str):
+    """Parses a string of templates into a list of ready to use FSMs.
+
+    Templates are only read and compiled once per file modification time,
+    subsequent calls return clones of the cached FSM.
+    """
+
+    fsms = []
+    for tmplt in template_str.split(':'):
+      template_path = os.path.join(self.template_dir, tmplt)
+      cache_key = (template_path, os.path.getmtime(template_path))
+      fsm = self.FSM.get(cache_key)
+      if fsm is None:
+        with open(template_path, 'r') as template_file:
+          fsm = textfsm.TextFSM(template_file)
+        self.FSM[cache_key] = fsm
+      fsms.append(fsm.Clone())
+
+    return fsms
+
   def ParseCmd(self, cmd_input, attributes=None, templates=None):
     """Creates a TextTable table of values from cmd_input string.
 
@@ -273,28 +352,24 @@ class CliTable(texttable.TextTable):
         raise CliTableError('No template found for attributes: "%s"' %
                             attributes)
 
-    template_files = self._TemplateNamesToFiles(templates)
+    fsms = self._TemplateNamesToFsms(templates)
 
-    try:
-      # Re-initialise the table.
-      self.Reset()
-      self._keys = set()
-      self.table = self._ParseCmdItem(self.raw, template_file=template_files[0])
-
-      # Add additional columns from any additional tables.
-      for tmplt in template_files[1:]:
-        self.extend(self._ParseCmdItem(self.raw, template_file=tmplt),
-                    set(self._keys))
-    finally:
-      for f in template_files:
-        f.close()
-
-  def _ParseCmdItem(self, cmd_input, template_file=None):
+    # Re-initialise the table.
+    self.Reset()
+    self._keys = set()
+    self.table = self._ParseCmdItem(self.raw, fsm=fsms[0])
+
+    # Add additional columns from any additional tables.
+    for fsm in fsms[1:]:
+      self.extend(self._ParseCmdItem(self.raw, fsm=fsm), set(self._keys))
+
+  def _ParseCmdItem(self, cmd_input, template_file=None, fsm=None):
     """Creates Texttable with output of command.
 
     Args:
       cmd_input: String, Device response.
       template_file: File object, template to parse with.
+      fsm: TextFSM object, already compiled FSM to parse with.
 
     Returns:
       TextTable containing command output.
@@ -302,8 +377,9 @@ class CliTable(texttable.TextTable):
     Raises:
       CliTableError: A template was not found for the given command.
     """
-    # Build FSM machine from the template.
-    fsm = textfsm.TextFSM(template_file)
+    if fsm is None:
+      # Build FSM machine from the template.
+      fsm = textfsm.TextFSM(template_file)
     if not self._keys:
       self._keys = set(fsm.GetValuesByAttrib('Key'))
 
@@ -30,6 +30,7 @@ from __future__ import print_function
 from __future__ import unicode_literals
 
 
+import copy
 import getopt
 import inspect
 import re
@@ -40,6 +41,11 @@ from builtins import str      # pylint: disable=redefined-builtin
 from builtins import zip      # pylint: disable=redefined-builtin
 import six
 
+try:
+  from re import _parser as sre_parse  # Python 3.11+
+except ImportError:
+  import sre_parse  # pylint: disable=deprecated-module
+
 
 class Error(Exception):
   """Base class for errors."""
@@ -165,6 +171,13 @@ class TextFSMOptions(object):
         value_idx = self.value.fsm.values.index(self.value)
         # Go up the list from the end until we see a filled value.
         # pylint: disable=protected-access
+        if self.value.fsm._columns is not None:
+          column = self.value.fsm._columns[value_idx]
+          for row_idx in range(len(column) - 1, -1, -1):
+            if column[row_idx]:
+              break
+            column[row_idx] = self.value.value
+          return
         for result in reversed(self.value.fsm._result):
           if result[value_idx]:
             # Stop when a record has this column already.
@@ -407,6 +420,8 @@ class TextFSMRule(object):
     new_state: Label to jump to on action
     regex_obj: Compiled regex for which the rule matches.
     line_num: Integer row number of Value.
+    literal_prefix: Literal text every matching line starts with.
+    literal: Longest literal text every matching line contains.
   """
   # Implicit default is '(regexp) -> Next.NoRecord'
   MATCH_ACTION = re.compile(r'(?P<match>.*)(\s->(?P<action>.*))')
@@ -449,6 +464,8 @@ class TextFSMRule(object):
     self.record_op = ''            # Equivalent to 'NoRecord'.
     self.new_state = ''            # Equivalent to current state.
     self.line_num = line_num
+    self.literal_prefix = ''
+    self.literal = ''
 
     line = line.strip()
     if not line:
@@ -480,6 +497,9 @@ class TextFSMRule(object):
           "Invalid regular expression: '%s'. Line: %s." %
           (self.regex, self.line_num))
 
+    # Lets the FSM skip the regex for lines that cannot possibly match.
+    self.literal_prefix, self.literal = self._RequiredLiterals(self.regex)
+
     # No '->' present, so done.
     if not match_action:
       return
@@ -524,6 +544,56 @@ class TextFSMRule(object):
             'Alphanumeric characters only in state names. Line: %s.'
             % (self.line_num))
 
+  @classmethod
+  def _FlattenGroups(cls, items):
+    """Inlines the contents of groups that are matched exactly once."""
+    flat = []
+    for op, av in items:
+      # Groups that change flags (e.g. '(?i:...)') are kept opaque.
+      if op is sre_parse.SUBPATTERN and not av[1] and not av[2]:
+        flat.extend(cls._FlattenGroups(av[3]))
+      else:
+        flat.append((op, av))
+    return flat
+
+  @classmethod
+  def _RequiredLiterals(cls, regex):
+    """Finds literal text that a line must have for the regex to match it.
+
+    Only literals in the top level sequence of the regex (including groups
+    that are not repeated or optional) are considered.
+
+    Args:
+      regex: (str), the rule regex, matched from the start of a line.
+
+    Returns:
+      A tuple of the literal prefix and the longest literal substring, either
+      is the empty string if there is none.
+    """
+    parsed = sre_parse.parse(regex)
+    if parsed.state.flags & re.IGNORECASE:
+      return '', ''
+
+    prefix = None
+    runs = []
+    run = []
+    for op, av in cls._FlattenGroups(parsed):
+      if op is sre_parse.LITERAL:
+        run.append(chr(av))
+      elif op is sre_parse.AT:
+        # Anchors don't consume any characters.
+        continue
+      else:
+        if prefix is None:
+          prefix = ''.join(run)
+        runs.append(''.join(run))
+        run = []
+    runs.append(''.join(run))
+    if prefix is None:
+      prefix = runs[0]
+
+    return prefix, max(runs, key=len)
+
   def __str__(self):
     """Prints out the FSM Rule, mimic the input file."""
 
@@ -577,6 +647,8 @@ class TextFSM(object):
     self._cur_state = None
     # Name of the current state.
     self._cur_state_name = None
+    # Per column record storage, only set while parsing with ParseTextToColumns.
+    self._columns = None
 
     # Read and parse FSM definition.
     # Restore the file pointer once done.
@@ -602,6 +674,22 @@ class TextFSM(object):
 
     return result
 
+  def Clone(self):
+    """Returns a ready to use copy of the FSM without re-parsing the template.
+
+    States, rules and compiled regexes are read-only once the template is
+    parsed and are shared with the original. Values carry per-parse state, so
+    each clone gets its own copy of them.
+
+    Returns:
+      TextFSM object, reset to the starting state.
+    """
+    clone = copy.copy(self)
+    # Values hold a back-reference to the FSM, point it at the clone instead.
+    clone.values = copy.deepcopy(self.values, {id(self): clone})
+    clone.Reset()
+    return clone
+
   def Reset(self):
     """Preserves FSM but resets starting state and current record."""
 
@@ -612,6 +700,8 @@ class TextFSM(object):
     # Clear table of results and current record.
     self._result = []
     self._ClearAllRecord()
+    # Incomplete last line of the output passed to Feed().
+    self._partial_line = ''
 
   @property
   def header(self):
@@ -662,7 +752,11 @@ class TextFSM(object):
     while None in cur_record:
       cur_record[cur_record.index(None)] = ''
 
-    self._result.append(cur_record)
+    if self._columns is not None:
+      for column, value in zip(self._columns, cur_record):
+        column.append(value)
+    else:
+      self._result.append(cur_record)
     self._ClearRecord()
 
   def _Parse(self, template):
@@ -903,6 +997,90 @@ class TextFSM(object):
 
     return self._result
 
+  def Feed(self, chunk):
+    """Passes the next chunk of CLI output through FSM.
+
+    Chunks do not need to end on a line boundary, an incomplete last line is
+    kept until a later chunk (or Close) completes it. Returned records are
+    removed from the FSM, so memory use is bounded by the records still in
+    progress rather than by the size of the output.
+
+    Args:
+      chunk: (str), Text to parse, the continuation of any previous chunks.
+
+    Raises:
+      TextFSMError: An error occurred within the FSM.
+
+    Returns:
+      List of Lists, the records completed since the last call.
+    """
+
+    lines = (self._partial_line + chunk).splitlines(True)
+    self._partial_line = ''
+    if lines:
+      last_line = lines[-1]
+      # A trailing '\r' can be the first half of a '\r\n' split over chunks.
+      if last_line.endswith('\r') or last_line.splitlines()[0] == last_line:
+        self._partial_line = lines.pop()
+
+    for line in lines:
+      if self._cur_state_name in ('End', 'EOF'):
+        break
+      self._CheckLine(line.splitlines()[0])
+
+    if self._cur_state_name in ('End', 'EOF'):
+      self._partial_line = ''
+
+    return self._PopRecords()
+
+  def Close(self):
+    """Completes parsing of the output passed to Feed.
+
+    Parses any incomplete last line and triggers the EOF state, like ParseText
+    does at the end of the text.
+
+    Raises:
+      TextFSMError: An error occurred within the FSM.
+
+    Returns:
+      List of Lists, the records not yet returned by Feed.
+    """
+
+    if self._partial_line and self._cur_state_name not in ('End', 'EOF'):
+      self._CheckLine(self._partial_line.splitlines()[0])
+    self._partial_line = ''
+
+    if self._cur_state_name != 'End' and 'EOF' not in self.states:
+      # Implicit EOF performs Next.Record operation.
+      # Suppressed if Null EOF state is instantiated.
+      self._AppendRecord()
+
+    return self._PopRecords(final=True)
+
+  def _PopRecords(self, final=False):
+    """Removes and returns the records that can no longer change.
+
+    A Fillup value can still update the trailing records that don't have it
+    set, those are held back until the value is set or parsing is final.
+
+    Args:
+      final: (boolean), True if no more lines will be parsed.
+
+    Returns:
+      List of Lists.
+    """
+
+    count = len(self._result)
+    if not final:
+      for value_idx, value in enumerate(self.values):
+        if 'Fillup' in value.OptionNames():
+          while count and not self._result[count - 1][value_idx]:
+            count -= 1
+
+    records = self._result[:count]
+    del self._result[:count]
+    return records
+
   def ParseTextToDicts(self, *args, **kwargs):
     """Calls ParseText and turns the result into list of dicts.
 
@@ -922,13 +1100,44 @@ class TextFSM(object):
     """
 
     result_lists = self.ParseText(*args, **kwargs)
+    header = self.header
     result_dicts = []
 
     for row in result_lists:
-      result_dicts.append(dict(zip(self.header, row)))
+      result_dicts.append(dict(zip(header, row)))
 
     return result_dicts
 
+  def ParseTextToColumns(self, text, eof=True):
+    """Passes CLI output through FSM and returns the records as columns.
+
+    Records are stored directly into one list per column as they are saved,
+    no per record lists or dicts are kept. Each column can be handed as is to
+    e.g. numpy.asarray() or pyarrow.array().
+
+    Args:
+      text: (str), Text to parse with embedded newlines.
+      eof: (boolean), Set to False if we are parsing only part of the file.
+            Suppresses triggering EOF state.
+
+    Raises:
+      TextFSMError: An error occurred within the FSM.
+
+    Returns:
+      Dict of column header to list of values, all lists of the same length.
+      Only records saved by this call are included.
+    """
+
+    header = self.header
+    self._columns = [[] for _ in header]
+    try:
+      self.ParseText(text, eof=eof)
+      columns = self._columns
+    finally:
+      self._columns = None
+
+    return dict(zip(header, columns))
+
   def _CheckLine(self, line):
     """Passes the line through each rule until a match is made.
 
@@ -936,6 +1145,9 @@ class TextFSM(object):
       line: A string, the current input line.
     """
     for rule in self._cur_state:
+      # Skip rules that cannot match without running the regex.
+      if not line.startswith(rule.literal_prefix) or rule.literal not in line:
+        continue
       matched = self._CheckRule(rule, line)
       if matched:
         for value in matched.groupdict():
@@ -0,0 +1,77 @@
+import csv
+import time
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from netmiko import ConnectHandler
+
+# Shared fleet push code for switch/switchconfigurer.py and Broadband Router/broadbandconfigurer.py
+
+
+# Function to read the inventory file (one device per row, each with its own CSV file)
+def load_inventory(inventory_file):
+    inventory = []
+    with open(inventory_file, mode='r') as file:
+        reader = csv.DictReader(file, delimiter=';')
+        for row in reader:
+            if not row['host']:
+                continue  # Skip empty rows
+            inventory.append({'host': row['host'].strip(), 'csv_file': row['csv_file'].strip()})
+    return inventory
+
+# Function to build the connection parameters of one inventory device from the common parameters
+def device_params(base_device, host, timeout):
+    device = dict(base_device)
+    device.update({
+        'host': host,
+        'session_log': f"session_log_{host}.txt",  # Every device gets its own session log
+        'conn_timeout': timeout,
+        'banner_timeout': timeout,
+        'auth_timeout': timeout,
+        'read_timeout_override': timeout,
+    })
+    return device
+
+# Function to pass the configuration commands through, failing once the device deadline has passed
+def commands_until(config_commands, deadline):
+    for command in config_commands:
+        if time.monotonic() > deadline:
+            raise TimeoutError("Device deadline exceeded")
+        yield command
+
+# Function to connect to one device and apply its configuration commands
+def push_config(device, config_commands, read_timeout=15, cmd_window=1, deadline=None):
+    with ConnectHandler(**device) as net_connect:
+        net_connect.enable()  # Enter enable mode
+        if deadline is not None:
+            config_commands = commands_until(config_commands, deadline)
+        # Send configuration commands to the device
+        net_connect.send_config_set(config_commands, read_timeout=read_timeout, cmd_window=cmd_window)
+
+# Function to run push_device(entry, deadline) for one inventory entry and time it
+def run_device(push_device, entry, deadline_seconds):
+    result = {'host': entry['host'], 'csv_file': entry['csv_file'], 'success': False, 'error': None}
+    start_time = time.monotonic()
+    try:
+        push_device(entry, start_time + deadline_seconds)
+        result['success'] = True
+    except Exception as e:
+        result['error'] = str(e)
+    result['elapsed'] = time.monotonic() - start_time
+    return result
+
+# Function to run push_device for every inventory entry using a bounded worker pool
+# Returns the results in inventory order (the same host can be listed more than once)
+def push_inventory(inventory, push_device, workers, deadline_seconds):
+    results = [None] * len(inventory)
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        pending = {executor.submit(run_device, push_device, entry, deadline_seconds): index
+                   for index, entry in enumerate(inventory)}
+        done_count = 0
+        while pending:
+            done, _ = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                result = future.result()
+                results[pending.pop(future)] = result
+                done_count += 1
+                status = "OK" if result['success'] else f"FAILED ({result['error']})"
+                print(f"[{done_count}/{len(inventory)}] {result['host']}: {status} in {result['elapsed']:.1f}s")
+    return results
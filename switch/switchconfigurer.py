@@ -1,5 +1,10 @@
 import csv
-from netmiko import ConnectHandler
+import os
+import sys
+
+# fleet_push.py (shared with the broadband router script) is in the parent directory
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+import fleet_push
 
 # Define the switch credentials and connection parameters
 switch = {
@@ -11,124 +16,165 @@ switch = {
     'session_log': 'session_log.txt',  # Enable session logging to file
 }
 
+# Fleet push settings: set inventory_file to push every switch in the inventory in parallel
+inventory_file = None  # e.g. 'inventory.csv' (columns: host;csv_file), None = single switch above
+max_workers = 20  # Maximum number of switches configured at the same time
+device_timeout = 60  # Per-switch timeout (seconds) for connecting and for each read
+device_deadline = 600  # Maximum total time (seconds) for one switch, checked between config commands
+cmd_window = 10  # Config commands sent ahead of their echo (1 = wait for every echo)
+
+vlan_range_syntax = True  # Configure unnamed VLAN ranges as 'vlan 1000-4000' and ranged trunk lists (False = one 'vlan' block per VLAN)
+
 # Function to expand VLAN ranges (e.g., "400-600" -> "400,401,402,...,600")
 def expand_vlan_range(vlan_range):
     expanded_vlans = []
+    for start_vlan, end_vlan in parse_vlan_ranges(vlan_range):
+        expanded_vlans.extend(range(start_vlan, end_vlan + 1))
+    return expanded_vlans
+
+# Function to parse VLAN ranges into (start, end) pairs in CSV order, merging VLANs that follow on (e.g., "400-600,601" -> [(400, 601)])
+def parse_vlan_ranges(vlan_range):
+    ranges = []
     for part in vlan_range.split(','):
         if '-' in part:
             start_vlan, end_vlan = part.split('-')
-            expanded_vlans.extend(range(int(start_vlan), int(end_vlan) + 1))
+            start_vlan, end_vlan = int(start_vlan), int(end_vlan)
         else:
-            expanded_vlans.append(int(part))
-    return expanded_vlans
+            start_vlan = end_vlan = int(part)
+        if ranges and start_vlan == ranges[-1][1] + 1:
+            ranges[-1] = (ranges[-1][0], end_vlan)
+        else:
+            ranges.append((start_vlan, end_vlan))
+    return ranges
+
+# Function to format (start, end) pairs as Cisco VLAN range syntax (e.g., [(400, 600), (700, 700)] -> "400-600,700")
+def format_vlan_ranges(vlan_ranges):
+    return ','.join(f"{start_vlan}-{end_vlan}" if start_vlan != end_vlan else f"{start_vlan}"
+                    for start_vlan, end_vlan in vlan_ranges)
+
+# Function to format a VLAN list for 'switchport trunk allowed vlan' (ranged only with vlan_range_syntax)
+def format_vlan_list(vlan_ranges):
+    if vlan_range_syntax:
+        return format_vlan_ranges(vlan_ranges)
+    return ','.join(str(vlan) for start_vlan, end_vlan in vlan_ranges for vlan in range(start_vlan, end_vlan + 1))
+
+# Function to generate the VLAN creation commands, one block per VLAN or one block for a row of unnamed VLANs
+def vlan_commands(vlan_ranges, description):
+    # IOS only accepts a VLAN name for a single VLAN, so only rows without a name are collapsed
+    if vlan_range_syntax and not description and (len(vlan_ranges) > 1 or vlan_ranges[0][0] != vlan_ranges[0][1]):
+        yield f"vlan {format_vlan_ranges(vlan_ranges)}"
+        yield "exit"  # Exit VLAN configuration mode
+        return
+    for start_vlan, end_vlan in vlan_ranges:
+        for vlan in range(start_vlan, end_vlan + 1):
+            yield f"vlan {vlan}"
+            yield f" name {description}"  # This may be omitted if not supported
+            yield "exit"  # Exit VLAN configuration mode
 
 # Function to handle port ranges and single ports
-def handle_ports(ports, vlan_id, description, switch, is_management=False):
+def handle_ports(ports, vlan_ranges, description, switch, is_management=False):
     switch = switch - 1
     if switch < 0:
         switch = 0
-    config_commands = []
-    
+
     # Split ports by commas
     for port in ports.split(','):
         if '-' in port:
             # Handle range of ports (e.g., 1-4)
             start_port, end_port = port.split('-')
-            config_commands.append(f"interface range FastEthernet {switch}/{start_port} - {end_port}")
+            yield f"interface range FastEthernet {switch}/{start_port} - {end_port}"
         else:
             # Handle single port
-            config_commands.append(f"interface FastEthernet {switch}/{port}")
-        
+            yield f"interface FastEthernet {switch}/{port}"
+
         # Check if the description indicates trunk or uplink
         if 'trunk' in description.lower() or 'uplink' in description.lower():
-            config_commands.append(" switchport mode trunk")
-            if vlan_id:  # If VLAN filtering is specified
-                config_commands.append(f" switchport trunk allowed vlan {','.join(map(str, vlan_id))}")  # Apply VLAN filtering for trunk ports
+            yield " switchport mode trunk"
+            if vlan_ranges:  # If VLAN filtering is specified
+                yield f" switchport trunk allowed vlan {format_vlan_list(vlan_ranges)}"  # Apply VLAN filtering for trunk ports
         else:
             # For non-trunk ports (access ports)
-            config_commands.append(f" switchport access vlan {vlan_id[0]}")  # Assuming first VLAN for access ports
-            config_commands.append(f" description {description} port")
+            yield f" switchport access vlan {vlan_ranges[0][0]}"  # Assuming first VLAN for access ports
+            yield f" description {description} port"
             if is_management:
-                config_commands.append(" switchport mode access")
-        
-        config_commands.append(" no shutdown")
-        config_commands.append("exit")  # Ensure clean exit
-    return config_commands
+                yield " switchport mode access"
 
-# Define a function to process the CSV data and generate configuration commands
-def generate_config(csv_file):
-    config_commands = []
-    ip_routing_needed = False  # Flag to track if IP routing is needed
+        yield " no shutdown"
+        yield "exit"  # Ensure clean exit
 
+# Define a function to process the CSV data and yield the configuration commands one by one
+def render_config(csv_file):
     # Open the CSV file and read it
     with open(csv_file, mode='r') as file:
-        reader = csv.DictReader(file, delimiter=';')
-
-        for row in reader:
-            vlan_id = row['Vlan']
-            description = row['Description']
-            ip_address = row['IP Address']
-            subnet_mask = row['Netmask']
-            ports = row['Ports']
-            switchNr = row['Switch']
-            print(f"Switch: {switchNr} for vlan {vlan_id}")
-            
-            # Expand VLAN range if necessary
-            expanded_vlan_ids = expand_vlan_range(vlan_id) if vlan_id else []
-
-            # Check if VLAN number goes above the standard VTP range of 1-1005
-            if expanded_vlan_ids and min(expanded_vlan_ids) > 1005:
-                config_commands.append("vtp mode transparent")
-
-            # Add VLAN creation commands
-            for vlan in expanded_vlan_ids:
-                config_commands.append(f"vlan {vlan}")
-                config_commands.append(f" name {description}")  # This may be omitted if not supported
-                config_commands.append("exit")  # Exit VLAN configuration mode
-
-            # Special case for Management VLAN
-            if ip_address and (description.lower().startswith("management") or description.lower().startswith("mgmt")):
-                ip_routing_needed = True
-                config_commands.append(f"interface vlan{expanded_vlan_ids[0]}")  # Management VLAN typically uses the first VLAN ID
-                config_commands.append(f" description {description} (Management VLAN)")
-                config_commands.append(f" ip address {ip_address} {subnet_mask}")
-                config_commands.append(" no shutdown")
-                config_commands.append("exit")  # Exit interface configuration mode
-                # Mark ports as part of the management VLAN
-                port_commands = handle_ports(ports, expanded_vlan_ids, description, int(switchNr), is_management=True)
+        rows = list(csv.DictReader(file, delimiter=';'))
+
+    # IP routing goes at the top of the configuration if any Layer 3 VLAN is configured
+    ip_routing_needed = any(row['IP Address'] for row in rows)
+    if ip_routing_needed:
+        yield "ip routing"
+
+    port_commands = []  # A row without ports repeats the port configuration of the previous row
+    for row in rows:
+        vlan_id = row['Vlan']
+        description = row['Description']
+        ip_address = row['IP Address']
+        subnet_mask = row['Netmask']
+        ports = row['Ports']
+        switchNr = row['Switch']
+        print(f"Switch: {switchNr} for vlan {vlan_id}")
+
+        # Parse VLAN range if necessary
+        vlan_ranges = parse_vlan_ranges(vlan_id) if vlan_id else []
+
+        # Check if VLAN number goes above the standard VTP range of 1-1005
+        if vlan_ranges and min(start_vlan for start_vlan, end_vlan in vlan_ranges) > 1005:
+            yield "vtp mode transparent"
+
+        # Add VLAN creation commands
+        if vlan_ranges:
+            yield from vlan_commands(vlan_ranges, description)
+
+        # Special case for Management VLAN
+        if ip_address and (description.lower().startswith("management") or description.lower().startswith("mgmt")):
+            yield f"interface vlan{vlan_ranges[0][0]}"  # Management VLAN typically uses the first VLAN ID
+            yield f" description {description} (Management VLAN)"
+            yield f" ip address {ip_address} {subnet_mask}"
+            yield " no shutdown"
+            yield "exit"  # Exit interface configuration mode
+            # Mark ports as part of the management VLAN
+            port_commands = list(handle_ports(ports, vlan_ranges, description, int(switchNr), is_management=True))
+        else:
+            if ip_address:
+                # Layer 3 VLAN configuration
+                yield f"interface vlan{vlan_ranges[0][0]}"  # Layer 3 interface uses the first VLAN ID
+                yield f" description {description}"
+                yield f" ip address {ip_address} {subnet_mask}"
+                yield " no shutdown"
+                yield "exit"  # Exit interface configuration mode
             else:
-                if ip_address:
-                    # Layer 3 VLAN configuration
-                    ip_routing_needed = True
-                    config_commands.append(f"interface vlan{expanded_vlan_ids[0]}")  # Layer 3 interface uses the first VLAN ID
-                    config_commands.append(f" description {description}")
-                    config_commands.append(f" ip address {ip_address} {subnet_mask}")
-                    config_commands.append(" no shutdown")
-                    config_commands.append("exit")  # Exit interface configuration mode
-                else:
-                    # Layer 2 VLAN configuration
-                    config_commands.append(f"! Skipping Layer 3 configuration for VLAN {expanded_vlan_ids[0]} (Layer 2 only)")
-                
-                # Check if ports are defined
-                if ports:
-                    port_commands = handle_ports(ports, expanded_vlan_ids, description, int(switchNr))
-
-            # Add port configuration commands
-            config_commands.extend(port_commands)
-            config_commands.append("")  # Empty line for readability
-
-    # Enable IP routing if needed
+                # Layer 2 VLAN configuration
+                yield f"! Skipping Layer 3 configuration for VLAN {vlan_ranges[0][0]} (Layer 2 only)"
+
+            # Check if ports are defined
+            if ports:
+                port_commands = list(handle_ports(ports, vlan_ranges, description, int(switchNr)))
+
+        # Add port configuration commands
+        yield from port_commands
+        yield ""  # Empty line for readability
+
     if ip_routing_needed:
-        config_commands.insert(0, "ip routing")  # Add at the top of the configuration
-        config_commands.append("! IP routing was enabled because Layer 3 VLANs are configured. (first line of the config)")
+        yield "! IP routing was enabled because Layer 3 VLANs are configured. (first line of the config)"
 
     # Add commands to disable VLAN 1
-    config_commands.append("interface vlan1")
-    config_commands.append(" shutdown")
-    config_commands.append("exit")
-    config_commands.append("! VLAN 1 has been disabled")
+    yield "interface vlan1"
+    yield " shutdown"
+    yield "exit"
+    yield "! VLAN 1 has been disabled"
 
-    return config_commands
+# Define a function to process the CSV data and generate configuration commands
+def generate_config(csv_file):
+    return list(render_config(csv_file))
 
 # Define a function to save the generated commands to a file
 def save_config_to_file(config_commands, output_file):
@@ -137,25 +183,44 @@ def save_config_to_file(config_commands, output_file):
             file.write(command + '\n')
     print(f"Configuration commands saved to {output_file}")
 
+# Function to connect to one switch and apply its configuration commands
+def push_config(device, config_commands, read_timeout=15, deadline=None):
+    fleet_push.push_config(device, config_commands, read_timeout=read_timeout, cmd_window=cmd_window, deadline=deadline)
+
+# Function to generate and push the configuration for one inventory entry
+def push_device(entry, deadline):
+    host = entry['host']
+    device = fleet_push.device_params(switch, host, device_timeout)
+    output_file = f"switch_config_{host}.txt"
+    # Stream the rendered commands to the config file, then push straight from the file
+    save_config_to_file(render_config(entry['csv_file']), output_file)
+    with open(output_file, mode='r') as config_commands:
+        push_config(device, config_commands, read_timeout=device_timeout, deadline=deadline)
+
 # Main function to run the script
 def main():
+    # Fleet mode: configure every switch listed in the inventory file
+    if inventory_file:
+        inventory = fleet_push.load_inventory(inventory_file)
+        results = fleet_push.push_inventory(inventory, push_device, max_workers, device_deadline)
+        failed = [result for result in results if not result['success']]
+        print(f"Configuration applied to {len(results) - len(failed)}/{len(results)} switches.")
+        for result in failed:
+            print(f"Failed: {result['host']} ({result['error']})")
+        return
+
     # File paths
     csv_file = 'BST-C-Core-2.csv'  # Path to your CSV file
     output_file = 'switch_config.txt'  # Path to save the generated config file
 
-    # Generate the configuration commands from CSV data
-    config_commands = generate_config(csv_file)
-
-    # Save the configuration commands to a file
-    save_config_to_file(config_commands, output_file)
+    # Generate the configuration commands from CSV data and save them to a file
+    save_config_to_file(render_config(csv_file), output_file)
 
-    # Connect to the switch using Netmiko and apply the configuration
+    # Connect to the switch using Netmiko and apply the configuration from the file
     try:
-        with ConnectHandler(**switch) as net_connect:
-            net_connect.enable()  # Enter enable mode
-            # Send configuration commands to the switch
-            net_connect.send_config_set(config_commands, read_timeout=15)
-            print("Configuration applied successfully to the switch.")
+        with open(output_file, mode='r') as config_commands:
+            push_config(switch, config_commands)
+        print("Configuration applied successfully to the switch.")
     except Exception as e:
         print(f"Error: {e}")
 